@@ -7,15 +7,24 @@ from cachetools.keys import hashkey
 
 import aws_cost_tool.cost_explorer as ce
 from aws_cost_tool.client import create_ce_client
+from aws_cost_tool.response_cache import DEFAULT_CACHE_DIR, ResponseCache
 
 logger = logging.getLogger(__name__)
 #  Module-level cache
 cost_cache: TTLCache[Any, Any] = TTLCache(maxsize=128, ttl=14400)
+# One on-disk response cache per profile. Each profile may be a different
+# account, so sources never share one.
+response_caches: dict[str | None, ResponseCache] = {}
 
 
 def clear_cost_cache():
     logger.info("Clearing cost cache")
     cost_cache.clear()
+    ce.clear_region_cache()
+    ce.clear_metadata_cache()
+    # Past months are final, so only drop what may have changed since.
+    for response_cache in response_caches.values():
+        response_cache.clear(open_only=True)
 
 
 def cache_key(self, **kwargs):
@@ -24,14 +33,20 @@ def cache_key(self, **kwargs):
         k: tuple(v) if isinstance(v, list) else v for k, v in kwargs.items()
     }
 
-    # Generates the final stable cache key based on argument values, excluding
-    # the client object.
-    return hashkey(frozenset(hashable_params.items()))
+    # Generates the final stable cache key based on the profile and argument
+    # values, excluding the client object.
+    return hashkey(self.profile, frozenset(hashable_params.items()))
 
 
 class AWSCostSource:
-    def __init__(self, profile: str | None = None):
+    def __init__(self, profile: str | None = None, *, disk_cache: bool = True):
+        self.profile = profile
         self.client = create_ce_client(profile_name=profile)
+        self.response_cache: ResponseCache | None = None
+        if disk_cache:
+            self.response_cache = response_caches.setdefault(
+                profile, ResponseCache(DEFAULT_CACHE_DIR / (profile or "default"))
+            )
 
     @cached(cache=cost_cache, key=cache_key)
     def get_tags_for_key(self, **kwargs) -> list[str]:
@@ -40,9 +55,13 @@ class AWSCostSource:
     @cached(cache=cost_cache, key=cache_key)
     def fetch_service_costs(self, **kwargs) -> pd.DataFrame:
         logger.info(f"fetching service costs: {kwargs}")
-        return ce.fetch_service_costs(self.client, **kwargs)
+        return ce.fetch_service_costs(
+            self.client, response_cache=self.response_cache, **kwargs
+        )
 
     @cached(cache=cost_cache, key=cache_key)
     def fetch_service_costs_by_usage(self, **kwargs) -> pd.DataFrame:
         logger.info(f"fetching service costs by usage: {kwargs}")
-        return ce.fetch_service_costs_by_usage(self.client, **kwargs)
+        return ce.fetch_service_costs_by_usage(
+            self.client, response_cache=self.response_cache, **kwargs
+        )
@@ -79,6 +79,7 @@ def initialize_state():
         "data_dir": os.environ.get("DATA_DIR"),
         "profile": os.environ.get("AWS_PROFILE") or config_data.get("aws_profile"),
         "tag_key": os.environ.get("TAG_KEY") or config_data.get("tag_key", ""),
+        "disk_cache": not os.environ.get("NO_CACHE"),
         "cost_data": {},
         "last_fetched": None,
     } | ReportChoice.LAST_7_DAYS.settings()
@@ -95,7 +96,9 @@ def get_data_source() -> CostSource:
         case "file_data":
             return get_file_data()
         case _:
-            return AWSCostSource(st.session_state.profile)
+            return AWSCostSource(
+                st.session_state.profile, disk_cache=st.session_state.disk_cache
+            )
 
 
 def use_test_backend() -> bool:
@@ -334,7 +337,7 @@ def render_filter_strip(df: pd.DataFrame, key_prefix: str = "") -> pd.DataFrame:
         with col2:
             # We sort the tag by cost so the big spenders are at the top.
             sorted_tags = (
-                df.groupby("Tag")["Cost"]
+                df.groupby("Tag", observed=True)["Cost"]
                 .sum()
                 .sort_values(ascending=False)
                 .index.tolist()
@@ -384,7 +387,13 @@ def render_service_cost_report_tab(run_fetch: bool):
     with col2:
         ui.download_button(cost_df, "service cost", "aws_cost")
 
-    cost_report_df, total_df = generate_cost_report(cost_df, "Service", selector=top_n)
+    # cost_df is the frame kept in st.session_state.cost_data, so the same
+    # object comes back on every rerun until the next fetch; keep its pivot
+    # around while only top_n changes. Nothing here modifies it in place, which
+    # the cached pivot relies on.
+    cost_report_df, total_df = generate_cost_report(
+        cost_df, "Service", selector=top_n, cache_pivot=True
+    )
     ui.joint_table(cost_report_df, total_df)
     # Plotly wants the unpivoted data for plotting.
     melted_df = cost_report_df.reset_index().melt(
@@ -490,6 +499,7 @@ def render_tagged_breakdown_charts(selected_tag: str, cost_df: pd.DataFrame):
         "Select Time Period:",
         label_visibility="collapsed",
         options=time_periods,
+        format_func=lambda period: period.strftime("%Y-%m-%d"),
         index=0,
         width=300,
         key="selected_time_period",
@@ -499,7 +509,9 @@ def render_tagged_breakdown_charts(selected_tag: str, cost_df: pd.DataFrame):
     filtered_df = cost_df[
         (cost_df["StartDate"] == selected_period) & (cost_df["Tag"] == selected_tag)
     ]
-    region_df = filtered_df.groupby(["Region"], as_index=False)["Cost"].sum()
+    region_df = filtered_df.groupby(["Region"], as_index=False, observed=True)[
+        "Cost"
+    ].sum()
 
     col_left, col_right = st.columns([1, 1])
     with col_left:
@@ -647,6 +659,11 @@ def start_app():
             "it will override the --profile flag"
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the on-disk Cost Explorer response cache",
+    )
     args, unknown = parser.parse_known_args()
 
     # Pass the profile to the Streamlit app via an envvar
@@ -659,6 +676,9 @@ def start_app():
     if args.tag_key:
         os.environ["TAG_KEY"] = args.tag_key
 
+    if args.no_cache:
+        os.environ["NO_CACHE"] = "1"
+
     os.environ["CONFIG_DIR"] = str(args.config.expanduser().resolve())
     this_file = str(Path(__file__).resolve())
     sys.argv = ["streamlit", "run", this_file]
@@ -342,15 +342,15 @@ def _generate_mock_data(
     ranges = _generate_date_ranges(start, end, granularity)
     data = []
     for dr in ranges:
-        start_date_str = dr.start.strftime("%Y-%m-%d")
-        end_date_str = dr.end.strftime("%Y-%m-%d")
+        start_ts = pd.Timestamp(dr.start)
+        end_ts = pd.Timestamp(dr.end)
         for service in Services:
             for region in Regions:
                 cost = np.random.uniform(0.7, 1.3) * service.weight
                 data.append(
                     {
-                        "StartDate": date.fromisoformat(start_date_str),
-                        "EndDate": date.fromisoformat(end_date_str),
+                        "StartDate": start_ts,
+                        "EndDate": end_ts,
                         "Tag": tag,
                         "Service": service,
                         "Region": region,
@@ -369,15 +369,15 @@ def _generate_mock_usage_data(
 ) -> pd.DataFrame:
     data = []
     for dr in date_ranges:
-        start_date_str = dr.start.strftime("%Y-%m-%d")
-        end_date_str = dr.end.strftime("%Y-%m-%d")
+        start_ts = pd.Timestamp(dr.start)
+        end_ts = pd.Timestamp(dr.end)
         for usage_type, weight in usages.items():
             for region in Regions:
                 cost = np.random.uniform(0.7, 1.3) * weight
                 data.append(
                     {
-                        "StartDate": date.fromisoformat(start_date_str),
-                        "EndDate": date.fromisoformat(end_date_str),
+                        "StartDate": start_ts,
+                        "EndDate": end_ts,
                         "Tag": tag,
                         "Service": service,
                         "Usage_type": usage_type,
@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import duckdb
@@ -7,10 +8,11 @@ import pyarrow as pa
 import streamlit as st
 import yaml
 
+_SAFE_NAME_RE = re.compile(r"[^a-zA-Z0-9]+")
+
 
-@st.cache_data
 def sql_safe_name(key: str) -> str:
-    return re.sub(r"[^a-zA-Z0-9]+", "_", key).lower().strip("_")
+    return _SAFE_NAME_RE.sub("_", key).lower().strip("_")
 
 
 @st.cache_data
@@ -50,7 +52,8 @@ def is_query_safe(query: str) -> bool:
     return True
 
 
-@st.cache_data
+# Not cached: st.cache_data would hash every row of df to build the key, which
+# costs far more than reading the few index and column names.
 def get_column_names(df: pd.DataFrame) -> list[str]:
     # 1. Get names from the index (MultiIndex or Single)
     # Filter out 'None' for unnamed indices (like a standard RangeIndex)
@@ -67,14 +70,17 @@ def get_column_names(df: pd.DataFrame) -> list[str]:
 
 
 def get_sql_ready_df(df: pd.DataFrame) -> pd.DataFrame:
-    # Check if it's a MultiIndex OR if a single index has a name (e.g., 'Date')
-    # Standard 'RangeIndex' has no name and is just 0, 1, 2...
-    if isinstance(df.index, pd.MultiIndex) or df.index.name is not None:
-        # Reset all the name levels and leave the last one.
-        named_levels = [name for name in df.index.names[:-1] if name is not None]
-        return df.reset_index(named_levels)
+    # Reset all the named levels and leave the last one. A plain RangeIndex or
+    # any single index has nothing before its last level, so it is returned
+    # as is, without the copy reset_index would make.
+    named_levels = [name for name in df.index.names[:-1] if name is not None]
+    if not named_levels:
+        return df
+    return df.reset_index(named_levels)
+
 
-    return df
+def to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    return pa.Table.from_pandas(get_sql_ready_df(df))
 
 
 def on_query_select():
@@ -164,14 +170,24 @@ def render_sql_sandbox():
             # Create a private connection for this execution
             con = duckdb.connect(database=":memory:")
 
-            # Register each dataframe into the connection
-            for sql_name, orig_name in table_mapping.items():
-                df = get_sql_ready_df(data_dict[orig_name])
-                # Convert to Arrow Table before registering. This is zero-copy
-                # for most data and avoids the ._data attribute check. This is
-                # a quirk of Python 3.14, DuckDB's integration with pandas, and
-                # pandas 3.0 changes.
-                con.register(sql_name, pa.Table.from_pandas(df))
+            # Convert to Arrow Table before registering. This is zero-copy
+            # for most data and avoids the ._data attribute check. This is
+            # a quirk of Python 3.14, DuckDB's integration with pandas, and
+            # pandas 3.0 changes. The conversions are independent and release
+            # the GIL for the numeric blocks, so run them concurrently.
+            dfs = [data_dict[orig_name] for orig_name in table_mapping.values()]
+            with ThreadPoolExecutor() as executor:
+                arrow_tables = dict(
+                    zip(
+                        table_mapping.keys(),
+                        executor.map(to_arrow_table, dfs),
+                        strict=True,
+                    )
+                )
+
+            # Register each table into the connection
+            for sql_name, table in arrow_tables.items():
+                con.register(sql_name, table)
 
             # Execute and convert back to DataFrame
             result = con.execute(query).df()
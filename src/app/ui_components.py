@@ -10,7 +10,19 @@ row_style = {
 }
 
 
+def column_labels(columns: pd.Index) -> pd.Index:
+    """
+    String labels for table headers. Date columns are datetime64, which would
+    otherwise print with a 00:00:00 time part.
+    """
+    if isinstance(columns, pd.DatetimeIndex):
+        return pd.Index(columns.strftime("%Y-%m-%d"))
+    return columns.map(str)
+
+
 def df_table(df: pd.DataFrame):
+    df = df.copy(deep=False)
+    df.columns = column_labels(df.columns)
     dynamic_height = min((len(df) + 1) * 35, 318)
     st.dataframe(
         df.style.format("${:,.2f}").set_properties(**row_style),  # type: ignore
@@ -34,9 +46,12 @@ def joint_table(report_df: pd.DataFrame, totals_df: pd.DataFrame):
 
     # These usually came from a pivoted version of the long tables. If the column
     # headers are not JSON serializable, like date, then Streamlit will raise an
-    # exception. Make a shallow copy and force them into strings.
-    report_df = report_df.rename(columns=str)
-    totals_df = totals_df.rename(columns=str)
+    # exception. Make a shallow copy and force them into strings, relabeling
+    # the columns in place rather than rebuilding the frames through rename.
+    report_df = report_df.copy(deep=False)
+    report_df.columns = column_labels(report_df.columns)
+    totals_df = totals_df.copy(deep=False)
+    totals_df.columns = column_labels(totals_df.columns)
 
     # Render the main data table, which is sortable by the user.
     dynamic_height = min((len(report_df) + 1) * 35, 420)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Literal
 
 type Granularity = Literal["DAILY", "MONTHLY"]
@@ -12,6 +13,12 @@ type CostMetric = Literal[
 ]
 
 
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> date:
+    """Cached ISO string to date conversion, since the same strings recur a lot."""
+    return date.fromisoformat(value)
+
+
 @dataclass(frozen=True, kw_only=True)
 class DateRange:
     """
@@ -23,10 +30,17 @@ class DateRange:
 
     start: date
     end: date
+    _time_period: dict[str, str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.start >= self.end:
             raise ValueError("start date must be < end date")
+        # The instance is immutable, so the CE TimePeriod is built once.
+        object.__setattr__(
+            self,
+            "_time_period",
+            {"Start": self.start.isoformat(), "End": self.end.isoformat()},
+        )
 
     @classmethod
     def create(cls, start: date | str, end: date | str) -> DateRange:
@@ -53,25 +67,23 @@ class DateRange:
         an end date.
         The default end date is today.
         """
-        if delta <= 0 or delta > 12:
+        if delta <= 0:
             raise ValueError("delta must be > 0")
 
         end_date = cls._to_date(end) if end else cls._today()
 
-        # Calculate the total months since Year 0
-        total_months = (end_date.year * 12 + (end_date.month - 1)) - delta
-
-        # Convert back to year and month
-        new_year, month_idx = divmod(total_months, 12)
-        start_date = date(new_year, month_idx + 1, 1)
+        # Count in whole months since year 0, so any number of year boundaries
+        # can be crossed.
+        new_year, new_month = divmod(
+            end_date.year * 12 + end_date.month - 1 - delta, 12
+        )
+        start_date = date(new_year, new_month + 1, 1)
 
         return cls(start=start_date, end=end_date)
 
     def to_time_period(self) -> dict[str, str]:
-        return {
-            "Start": self.start.isoformat(),
-            "End": self.end.isoformat(),
-        }
+        """Returns the shared TimePeriod dict; callers must not mutate it."""
+        return self._time_period
 
     @staticmethod
     def _today() -> date:
@@ -87,7 +99,7 @@ class DateRange:
             return value
         if isinstance(value, str):
             try:
-                return datetime.fromisoformat(value).date()
+                return _parse_iso_date(value)
             except ValueError as e:
                 raise ValueError(f"Invalid date string: {value}") from e
         raise TypeError(f"Expected date or str, got {type(value).__name__}")
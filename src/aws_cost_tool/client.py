@@ -2,9 +2,12 @@ import io
 import logging
 import subprocess
 import sys
+import time
 from contextlib import redirect_stderr
+from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import (
     ClientError,
     NoCredentialsError,
@@ -21,18 +24,74 @@ logging.getLogger("urllib3").setLevel(logging.CRITICAL)
 
 logger = logging.getLogger(__name__)
 
+# How long a successful credential check is trusted before asking STS again.
+AUTH_CACHE_TTL = 300
 
-def check_aws_auth(profile_name: str | None = None) -> bool:
-    """Checks for valid credentials"""
+# Adaptive retries back off client-side when CE throttles, and the larger pool
+# lets concurrent region fetches each hold a keep-alive connection.
+CLIENT_CONFIG = Config(
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+# Profile name -> monotonic time when the last successful check expires.
+_auth_cache: dict[str | None, float] = {}
+# Sessions by profile name, and clients by (client name, profile name, region).
+# Plain dicts rather than functools.cache, so one profile can be dropped alone.
+_sessions: dict[str | None, boto3.Session] = {}
+_clients: dict[tuple[str, str | None, str | None], Any] = {}
+
+
+def _get_session(profile_name: str | None) -> boto3.Session:
+    if (session := _sessions.get(profile_name)) is None:
+        session = _sessions[profile_name] = boto3.Session(profile_name=profile_name)
+    return session
+
+
+def _get_client(client_name: str, profile_name: str | None, region: str | None):
+    key = (client_name, profile_name, region)
+    if (client := _clients.get(key)) is None:
+        client = _clients[key] = _get_session(profile_name).client(
+            client_name, region_name=region, config=CLIENT_CONFIG
+        )
+    return client
 
-    session = boto3.Session(profile_name=profile_name)
+
+def clear_client_cache():
+    """Drops all cached sessions, clients, and credential checks."""
+    _clients.clear()
+    _sessions.clear()
+    _auth_cache.clear()
+
+
+def _clear_profile_cache(profile_name: str | None):
+    """Drops the cached session, clients, and credential check of one profile."""
+    for key in list(_clients):
+        if key[1] == profile_name:
+            _clients.pop(key, None)
+    _sessions.pop(profile_name, None)
+    _auth_cache.pop(profile_name, None)
+
+
+def check_aws_auth(profile_name: str | None = None) -> bool:
+    """
+    Checks for valid credentials. The STS client comes from the same cached
+    session as the CE client, so the profile is only resolved once.
+    """
+    expiry = _auth_cache.get(profile_name)
+    if expiry is not None and time.monotonic() < expiry:
+        return True
 
     try:
         # Attempt to get identity
-        sts = session.client("sts")
+        sts = _get_client("sts", profile_name, None)
         # Suppress boto3 printing stack trace when credential expires
         with redirect_stderr(io.StringIO()):
             sts.get_caller_identity()
+        _auth_cache[profile_name] = time.monotonic() + AUTH_CACHE_TTL
         return True
     except (
         NoCredentialsError,
@@ -40,10 +99,14 @@ def check_aws_auth(profile_name: str | None = None) -> bool:
         TokenRetrievalError,
         UnauthorizedSSOTokenError,
     ):
+        # Don't keep a session that failed to resolve credentials; the next
+        # check should start from scratch. Other profiles are unaffected.
+        _clear_profile_cache(profile_name)
         return False
     except ClientError as e:
         if e.response["Error"]["Code"] in ["ExpiredToken", "ExpiredTokenException"]:
             # Temporary IAM credentials have expired.
+            _clear_profile_cache(profile_name)
             return False
         else:
             # It's a different AWS error (e.g., AccessDenied), so re-raise it
@@ -60,6 +123,8 @@ def refresh_credentials(profile_name: str | None = None):
         # Run the AWS CLI SSO login command
         subprocess.run(login_cmd, check=True)
         logger.info("Login successful.")
+        # Sessions created before the login may hold stale credentials.
+        clear_client_cache()
         return True
 
     except subprocess.CalledProcessError:
@@ -73,7 +138,8 @@ def create_ce_client(
     profile_name: str | None = None,
     region: str = "us-east-1",
 ):
+    # The auth check shares the cached session the client is built from. A
+    # login clears the cache, so the client then comes from a fresh session.
     if not check_aws_auth(profile_name):
         refresh_credentials(profile_name)
-    session = boto3.Session(profile_name=profile_name)
-    return session.client(client_name, region_name=region)
+    return _get_client(client_name, profile_name, region)
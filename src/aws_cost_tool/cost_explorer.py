@@ -1,67 +1,171 @@
 import logging
 import time
-from collections.abc import Iterator, Sequence
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
 
 from aws_cost_tool.ce_types import CostMetric, DateRange, Granularity
-
-API_SLEEP_VAL = 0.2
+from aws_cost_tool.rate_limit import TokenBucket
+from aws_cost_tool.response_cache import ResponseCache
+
+# Rate limit safety: AWS CE API is typically limited to ~1-10 requests/sec, so
+# all get_cost_and_usage calls share one limiter.
+CE_RATE_LIMITER = TokenBucket(rate=4.0, burst=4)
+# Cap on concurrent per-region requests; CE throttles at a handful of req/sec.
+MAX_REGION_WORKERS = 4
+
+# How long tag and service lookups are trusted before asking CE again. Tags
+# show up over the current month, but not often enough to refetch every rerun.
+METADATA_TTL = 3600
+# (fetch, client, *args) -> (monotonic expiry, result); see _memoized.
+_metadata_cache: dict[tuple, tuple[float, tuple[str, ...]]] = {}
+
+# We usually don't care about Marketplace spending in cost monitoring. Shared by
+# reference; boto3 only serializes it, so it is never mutated.
+_EXCLUDE_MARKETPLACE: dict[str, Any] = {
+    "Not": {"Dimensions": {"Key": "BILLING_ENTITY", "Values": ["AWS Marketplace"]}}
+}
 
 logger = logging.getLogger(__name__)
 
 
 ## Utilities to discover usable tag key and values
 def get_tag_keys(ce_client, *, dates: DateRange) -> list[str]:
-    """Get the list of all tag keys."""
+    """Get the list of all tag keys. Memoized like get_tags_for_key."""
     try:
-        response = ce_client.get_tags(TimePeriod=dates.to_time_period())
-        return response.get("Tags", [])
+        return list(_memoized(_tag_keys, ce_client, dates))
     except Exception as e:
         logger.error(f"Error fetching tag keys: {e}")
 
     return []
 
 
+def _tag_keys(ce_client, dates: DateRange) -> tuple[str, ...]:
+    CE_RATE_LIMITER.acquire()
+    response = ce_client.get_tags(TimePeriod=dates.to_time_period())
+    return tuple(response.get("Tags", []))
+
+
 def get_tags_for_key(ce_client, *, tag_key: str, dates: DateRange) -> list[str]:
-    """Get the list of all tag values for a given tag key."""
-    tag_keys = set()
+    """
+    Get the list of all tag values for a given tag key. botocore has no
+    paginator for get_tags, so follow NextPageToken by hand.
 
+    The result is memoized per client and arguments for METADATA_TTL seconds,
+    since the same lookup is repeated for every service breakdown; use
+    clear_metadata_cache to drop it sooner.
+    """
     try:
-        response = ce_client.get_tags(TimePeriod=dates.to_time_period(), TagKey=tag_key)
-        tag_keys.update(response.get("Tags", []))
+        return list(_memoized(_tags_for_key, ce_client, tag_key, dates))
     except Exception as e:
         logger.error(f"Error fetching tag keys: {e}")
+        return []
+
+
+def _tags_for_key(ce_client, tag_key: str, dates: DateRange) -> tuple[str, ...]:
+    # get_tags returns each value once, so the pages can simply be chained.
+    tags: list[str] = []
+    params = {"TimePeriod": dates.to_time_period(), "TagKey": tag_key}
+    while True:
+        CE_RATE_LIMITER.acquire()
+        response = ce_client.get_tags(**params)
+        tags.extend(response.get("Tags", []))
+        if not (token := response.get("NextPageToken")):
+            break
+        params["NextPageToken"] = token
 
     # Filter out all the aws tag values.
-    return sorted([key for key in tag_keys if not key.startswith("aws:")])
+    return tuple(sorted(tag for tag in tags if not tag.startswith("aws:")))
 
 
 ## Utilities to extract service names
 def get_all_aws_services(ce_client, dates: DateRange) -> list[str]:
-    """Return the list of services from AWS"""
+    """
+    Return the list of services from AWS. Memoized like get_tags_for_key.
+    """
+    return list(_memoized(_all_aws_services, ce_client, dates))
+
+
+def _all_aws_services(ce_client, dates: DateRange) -> tuple[str, ...]:
+    CE_RATE_LIMITER.acquire()
     response = ce_client.get_dimension_values(
         TimePeriod=dates.to_time_period(),
         Dimension="SERVICE",
         Context="COST_AND_USAGE",
     )
 
-    return sorted([item["Value"] for item in response["DimensionValues"]])
+    return tuple(sorted(item["Value"] for item in response["DimensionValues"]))
+
+
+def _memoized(fetch: Callable[..., tuple[str, ...]], *args) -> tuple[str, ...]:
+    """
+    Returns fetch(*args), reusing a result cached within the last METADATA_TTL
+    seconds. Errors propagate, so a failed lookup is never cached.
+    """
+    key = (fetch, *args)
+    now = time.monotonic()
+    entry = _metadata_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1]
+
+    result = fetch(*args)
+    # Drop whatever has expired, so the cache can't grow without bound.
+    for k, (expiry, _) in list(_metadata_cache.items()):
+        if now >= expiry:
+            _metadata_cache.pop(k, None)
+    _metadata_cache[key] = (now + METADATA_TTL, result)
+    return result
+
+
+def clear_metadata_cache():
+    """Forget all the memoized tag key, tag value and service name results."""
+    _metadata_cache.clear()
 
 
 ## Functions to retrieve cost data from AWS Cost Explorer with no additional processing.
 
 
-def paginate_ce(client, params: dict[str, Any]) -> Iterator[dict[str, Any]]:
-    """A generator that handles pagination of get_cost_and_usage."""
+def paginate_ce(
+    client, params: dict[str, Any], cache: ResponseCache | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    A generator that handles pagination of get_cost_and_usage. botocore ships
+    no paginator for this operation, so the page token is threaded by hand.
+
+    If a response cache is given, all the pages of a request are served from it
+    when present, and stored in it once fetched. The cache must belong to the
+    same account as the client.
+    """
+    if cache is None:
+        yield from _paginate_ce(client, params)
+        return
+
+    if (pages := cache.get(params)) is not None:
+        yield from pages
+        return
+
+    pages = []
+    for response in _paginate_ce(client, params):
+        pages.append(response)
+        yield response
+    cache.put(params, pages)
+
+
+def _paginate_ce(client, params: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    # Copy once so the token can be updated in place without touching the
+    # caller's dict.
+    params = dict(params)
     while True:
+        CE_RATE_LIMITER.acquire()
         response = client.get_cost_and_usage(**params)
         yield response
         token = response.get("NextPageToken")
         if not token:
             break
-        params = dict(params)
         params["NextPageToken"] = token
 
 
@@ -70,8 +174,30 @@ def fetch_active_regions(
     dates: DateRange,
     granularity: Granularity = "MONTHLY",
     min_cost: float = 0.01,
+    *,
+    response_cache: ResponseCache | None = None,
 ) -> list[str]:
-    """Returns the list of regions with positive cost for the period."""
+    """
+    Returns the list of regions with positive cost for the period. The result
+    is memoized per client and arguments, since the service and usage breakdowns
+    both need the same regions; use clear_region_cache to drop it.
+    """
+    return list(_active_regions(client, dates, granularity, min_cost, response_cache))
+
+
+def clear_region_cache():
+    """Forget all the memoized fetch_active_regions results."""
+    _active_regions.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _active_regions(
+    client,
+    dates: DateRange,
+    granularity: Granularity,
+    min_cost: float,
+    response_cache: ResponseCache | None,
+) -> tuple[str, ...]:
     # We only want to find regions we spent money. The cost metric doesn't matter.
     cost_metric = "UnblendedCost"
     params = {
@@ -81,15 +207,27 @@ def fetch_active_regions(
         "GroupBy": [{"Type": "DIMENSION", "Key": "REGION"}],
     }
 
-    regions = set()
+    # A range spanning several granularity periods comes back as one entry
+    # per period, so total each region over all of them. Pages only follow
+    # when there is more data, so there is nothing to cut short here.
+    region_costs: dict[str, float] = defaultdict(float)
+    for resp in paginate_ce(client, params, response_cache):
+        for period in resp["ResultsByTime"]:
+            for group in period["Groups"]:
+                cost = float(group["Metrics"][cost_metric]["Amount"])
+                region_costs[group["Keys"][0]] += cost
 
-    for resp in paginate_ce(client, params):
-        for group in resp["ResultsByTime"][0]["Groups"]:
-            cost = float(group["Metrics"][cost_metric]["Amount"])
-            if cost > min_cost:
-                regions.add(group["Keys"][0])
+    return tuple(region for region, cost in region_costs.items() if cost > min_cost)
 
-    return list(regions)
+
+def _group_key_columns(group_by: Sequence[dict[str, Any]]) -> list[str]:
+    """
+    Column names for the group_by keys: the capitalized dimension name, or Tag
+    for a tag group.
+    """
+    return [
+        "Tag" if k["Type"] == "TAG" else str(k["Key"]).capitalize() for k in group_by
+    ]
 
 
 def json_to_df(
@@ -104,29 +242,56 @@ def json_to_df(
     Returns a DataFrame has the following columns:
     StartDate, EndDate, <group_by> Cost
 
-    where <group_by> is the capitalized version of the argument.
+    where <group_by> is the capitalized version of the argument, except that a
+    tag group becomes a Tag column with the "tag_key$" prefix stripped.
     """
-    results = []
-    group_keys = [str(k["Key"]).capitalize() for k in group_by]
-    columns = ["StartDate", "EndDate", *group_keys, "Cost"]
+    group_keys = _group_key_columns(group_by)
+
+    # Accumulate column-wise rather than a dict per row; this is the layout
+    # pandas stores internally, so construction is a straight copy.
+    starts: list[str] = []
+    ends: list[str] = []
+    key_rows: list[list[str]] = []
+    costs: list[float] = []
     for period in response["ResultsByTime"]:
         start = period["TimePeriod"]["Start"]
         end = period["TimePeriod"]["End"]
         for group in period["Groups"]:
-            values = [
-                start,
-                end,
-                *group["Keys"],
-                float(group["Metrics"][cost_metric]["Amount"]),
-            ]
-            results.append(dict(zip(columns, values, strict=False)))
-
-    if not results:
-        return pd.DataFrame(columns=columns)
-
-    df = pd.DataFrame(results)
-    df["StartDate"] = pd.to_datetime(df["StartDate"]).dt.date
-    df["EndDate"] = pd.to_datetime(df["EndDate"]).dt.date
+            starts.append(start)
+            ends.append(end)
+            key_rows.append(group["Keys"])
+            costs.append(float(group["Metrics"][cost_metric]["Amount"]))
+
+    # Transpose the per-row keys into one list per group key. With no rows the
+    # same code path builds an empty frame with the full schema and dtypes.
+    keys = [list(col) for col in zip(*key_rows, strict=True)] or [
+        [] for _ in group_keys
+    ]
+
+    # Cost Explorer returns tag values as "tag_key$value"; strip the prefix
+    # while the values are still a plain list.
+    for i, k in enumerate(group_by):
+        if k["Type"] == "TAG":
+            prefix = f"{k['Key']}$"
+            keys[i] = [key.removeprefix(prefix) for key in keys[i]]
+
+    # The group keys hold a handful of distinct values repeated on every row,
+    # so store them as categoricals.
+    df = pd.DataFrame(
+        {
+            "StartDate": starts,
+            "EndDate": ends,
+            **{
+                name: pd.Categorical(values)
+                for name, values in zip(group_keys, keys, strict=True)
+            },
+            "Cost": costs,
+        }
+    )
+    # Keep the dates as datetime64 rather than Python date objects. The same
+    # few period strings repeat on every row, so the conversion is cached.
+    df["StartDate"] = pd.to_datetime(df["StartDate"], format="%Y-%m-%d", cache=True)
+    df["EndDate"] = pd.to_datetime(df["EndDate"], format="%Y-%m-%d", cache=True)
     return df
 
 
@@ -138,6 +303,7 @@ def _fetch_group_by_cost(
     filter_expr: dict[str, Any] | None = None,
     cost_metric: CostMetric,
     granularity: Granularity,
+    response_cache: ResponseCache | None = None,
 ) -> pd.DataFrame:
     """
     Fetches cost data with the specified group_by dimenion and filter. Each entry
@@ -147,11 +313,35 @@ def _fetch_group_by_cost(
     Returns a DataFrame has the following columns:
     StartDate, EndDate, <group_by> Cost
 
-    where <group_by> is the capitalized version of the argument.
+    where <group_by> is named as in json_to_df.
+    """
+    periods = _fetch_periods(
+        ce_client,
+        dates=dates,
+        group_by=group_by,
+        filter_expr=filter_expr,
+        cost_metric=cost_metric,
+        granularity=granularity,
+        response_cache=response_cache,
+    )
+    return json_to_df({"ResultsByTime": periods}, group_by, cost_metric)
+
+
+def _fetch_periods(
+    ce_client,
+    *,
+    dates: DateRange,
+    group_by: Sequence[dict[str, Any]],
+    filter_expr: dict[str, Any] | None = None,
+    cost_metric: CostMetric,
+    granularity: Granularity,
+    response_cache: ResponseCache | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fetches the ResultsByTime periods across all pages of a get_cost_and_usage
+    request. Periods without groups (e.g. inactive days at DAILY granularity)
+    contribute nothing, so they are dropped.
     """
-    results = []
-    group_keys = [str(k["Key"]).capitalize() for k in group_by]
-    columns = ["StartDate", "EndDate", *group_keys, "Cost"]
     params = {
         "TimePeriod": dates.to_time_period(),
         "GroupBy": group_by,
@@ -161,13 +351,71 @@ def _fetch_group_by_cost(
     if filter_expr:
         params["Filter"] = filter_expr
 
-    for response in paginate_ce(ce_client, params):
-        results.append(json_to_df(response, group_by, cost_metric))
+    periods: list[dict[str, Any]] = []
+    for response in paginate_ce(ce_client, params, response_cache):
+        periods.extend(p for p in response["ResultsByTime"] if p.get("Groups"))
+    return periods
+
 
-    if not results:
-        return pd.DataFrame(columns=columns)
+def _region_filter(region: str) -> dict[str, Any]:
+    return {"Dimensions": {"Key": "REGION", "Values": [region]}}
 
-    return pd.concat(results, ignore_index=True)
+
+def _fetch_by_region(
+    ce_client,
+    regions: Sequence[str],
+    *,
+    dates: DateRange,
+    group_by: Sequence[dict[str, Any]],
+    filter_expr: dict[str, Any],
+    cost_metric: CostMetric,
+    granularity: Granularity,
+    response_cache: ResponseCache | None = None,
+) -> pd.DataFrame:
+    """
+    Fetches the group_by costs once per region, combining filter_expr with a
+    region filter. The requests are I/O bound, so they run on a small thread
+    pool. Returns a single DataFrame as in json_to_df with an extra Region
+    column, with rows in the same order as regions.
+    """
+    region_group = {"Type": "DIMENSION", "Key": "REGION"}
+
+    def fetch_region(region: str) -> list[dict[str, Any]]:
+        periods = _fetch_periods(
+            ce_client,
+            dates=dates,
+            group_by=group_by,
+            filter_expr={"And": [_region_filter(region), filter_expr]},
+            cost_metric=cost_metric,
+            granularity=granularity,
+            response_cache=response_cache,
+        )
+        # Add the region as one more group key, so every region goes through
+        # json_to_df together and the result is built once, rather than
+        # building a frame per region and concatenating them.
+        return [
+            {
+                "TimePeriod": period["TimePeriod"],
+                "Groups": [
+                    {"Keys": [*g["Keys"], region], "Metrics": g["Metrics"]}
+                    for g in period["Groups"]
+                ],
+            }
+            for period in periods
+        ]
+
+    periods: list[dict[str, Any]] = []
+    if regions:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_REGION_WORKERS, len(regions))
+        ) as executor:
+            # map preserves the input order regardless of completion order.
+            for region_periods in executor.map(fetch_region, regions):
+                periods.extend(region_periods)
+
+    return json_to_df(
+        {"ResultsByTime": periods}, [*group_by, region_group], cost_metric
+    )
 
 
 def fetch_service_costs(
@@ -177,19 +425,15 @@ def fetch_service_costs(
     tag_key: str = "",
     cost_metric: CostMetric,
     granularity: Granularity,
+    response_cache: ResponseCache | None = None,
 ) -> pd.DataFrame:
     """
     Fetches the costs broken out by service, Tag, and Region. Returns a DataFrame
     with columns: StartDate, EndDate, Tag, Service, Region Cost
 
     If no tag_key is passed, then everything will be aggregated, and the returned
-    DataFrame has no Tag column.
+    DataFrame has no Tag column. Responses go through response_cache, if given.
     """
-    # We usually don't care about Marketplace spending in cost monitoring.
-    exclude_filter = {
-        "Not": {"Dimensions": {"Key": "BILLING_ENTITY", "Values": ["AWS Marketplace"]}}
-    }
-
     #  No tag breakdown
     if not tag_key:
         return _fetch_group_by_cost(
@@ -199,52 +443,33 @@ def fetch_service_costs(
                 {"Type": "DIMENSION", "Key": "SERVICE"},
                 {"Type": "DIMENSION", "Key": "REGION"},
             ],
-            filter_expr=exclude_filter,
+            filter_expr=_EXCLUDE_MARKETPLACE,
             cost_metric=cost_metric,
             granularity=granularity,
+            response_cache=response_cache,
         )
 
     # Else we want Tag breakdown; iterate by region because CE only limit us to
     # 2 dimensions in group_by,and region has significantly lower cardinality
     # compared to tags.
-    regions = fetch_active_regions(ce_client, dates, granularity, 0.01)
-    df_list = []
-    for region in regions:
-        region_filter = {"Dimensions": {"Key": "REGION", "Values": [region]}}
-        df = _fetch_group_by_cost(
-            ce_client,
-            dates=dates,
-            group_by=[
-                {"Type": "DIMENSION", "Key": "SERVICE"},
-                {"Type": "TAG", "Key": tag_key},
-            ],
-            filter_expr={"And": [region_filter, exclude_filter]},
-            cost_metric=cost_metric,
-            granularity=granularity,
-        )
-        if not df.empty:
-            df["Region"] = region
-            df_list.append(df)
-
-        # Rate limit safety: AWS CE API is typically limited to ~1-10 requests/sec
-        time.sleep(API_SLEEP_VAL)
-
-    columns = ["StartDate", "EndDate", "Tag", "Service", "Region", "Cost"]
-    if not df_list:
-        return pd.DataFrame(columns=columns)
-
-    df = pd.concat(df_list, ignore_index=True)
-    if df.empty:
-        return pd.DataFrame(columns=columns)
-
-    # Clean up the columns. Because the utility automatically grab the group key,
-    # which happens to be the tag_key value, we need to rename it back to Tag. We
-    # also need to strip the tag_key$ prefix that Cost Explorer returns.
-    df["Tag"] = df[tag_key].str.removeprefix(f"{tag_key}$")
-    df = df.drop(columns=[tag_key])
-    df = df[columns]
+    regions = fetch_active_regions(
+        ce_client, dates, granularity, 0.01, response_cache=response_cache
+    )
+    df = _fetch_by_region(
+        ce_client,
+        regions,
+        dates=dates,
+        group_by=[
+            {"Type": "DIMENSION", "Key": "SERVICE"},
+            {"Type": "TAG", "Key": tag_key},
+        ],
+        filter_expr=_EXCLUDE_MARKETPLACE,
+        cost_metric=cost_metric,
+        granularity=granularity,
+        response_cache=response_cache,
+    )
 
-    return df
+    return df[["StartDate", "EndDate", "Tag", "Service", "Region", "Cost"]]
 
 
 def fetch_service_costs_by_usage(
@@ -255,13 +480,14 @@ def fetch_service_costs_by_usage(
     tag_key: str = "",
     cost_metric: CostMetric,
     granularity: Granularity,
+    response_cache: ResponseCache | None = None,
 ) -> pd.DataFrame:
     """
     Fetches service costs broken out by Tag, Region, and Usage Type. Returns a
     DataFrame with columns: StartDate, EndDate, Tag, Usage_type, Region, Cost
 
     If no tag_key is passed, then everything will be aggregated, and the returned
-    DataFrame has no Tag column.
+    DataFrame has no Tag column. Responses go through response_cache, if given.
     """
     service_filter = {"Dimensions": {"Key": "SERVICE", "Values": [service]}}
     group_by = "USAGE_TYPE"
@@ -278,59 +504,46 @@ def fetch_service_costs_by_usage(
             filter_expr=service_filter,
             cost_metric=cost_metric,
             granularity=granularity,
+            response_cache=response_cache,
         )
 
     # Else we want Tag breakdown; iterate by region because CE only limit us to
     # 2 dimensions in group_by,and region has significantly lower cardinality
     # compared to tags.
-    regions = fetch_active_regions(ce_client, dates, granularity, 0.01)
-    df_list = []
-    for region in regions:
-        region_filter = {"Dimensions": {"Key": "REGION", "Values": [region]}}
-        df = _fetch_group_by_cost(
-            ce_client,
-            dates=dates,
-            group_by=[
-                {"Type": "DIMENSION", "Key": group_by.upper()},
-                {"Type": "TAG", "Key": tag_key},
-            ],
-            filter_expr={"And": [service_filter, region_filter]},
-            cost_metric=cost_metric,
-            granularity=granularity,
-        )
-        if not df.empty:
-            df["Region"] = region
-            df_list.append(df)
-
-        # Rate limit safety: AWS CE API is typically limited to ~1-10 requests/sec
-        time.sleep(API_SLEEP_VAL)
-
-    columns = ["StartDate", "EndDate", "Tag", "Usage_type", "Region", "Cost"]
-    if not df_list:
-        return pd.DataFrame(columns=columns)
-
-    df = pd.concat(df_list, ignore_index=True)
-    if df.empty:
-        return pd.DataFrame(columns=columns)
-
-    # Clean up the columns. Because the utility automatically grab the group key,
-    # which happens to be the tag_key value, we need to rename it back to Tag. We
-    # also need to strip the tag_key$ prefix that Cost Explorer returns.
-    df["Tag"] = df[tag_key].str.removeprefix(f"{tag_key}$")
-    df = df.drop(columns=[tag_key])
-    df = df[columns]
+    regions = fetch_active_regions(
+        ce_client, dates, granularity, 0.01, response_cache=response_cache
+    )
+    df = _fetch_by_region(
+        ce_client,
+        regions,
+        dates=dates,
+        group_by=[
+            {"Type": "DIMENSION", "Key": group_by.upper()},
+            {"Type": "TAG", "Key": tag_key},
+        ],
+        filter_expr=service_filter,
+        cost_metric=cost_metric,
+        granularity=granularity,
+        response_cache=response_cache,
+    )
 
-    return df
+    return df[["StartDate", "EndDate", "Tag", "Usage_type", "Region", "Cost"]]
 
 
 ## Utilites to transform the raw data into more useful summaries.
 def summarize_by_columns(
     df: pd.DataFrame, columns: list[str], threshold: float | None = 0.001
 ) -> pd.DataFrame:
-    """Utility to aggregate costs based on a list of columns."""
-    summary_df = df.groupby(columns, as_index=False)["Cost"].sum()
+    """
+    Utility to aggregate costs based on a list of columns. Groups are returned
+    in order of first appearance; sort the result if a particular order matters.
+    """
+    summary_df = df.groupby(columns, as_index=False, sort=False, observed=True)[
+        "Cost"
+    ].sum()
     if threshold is not None and threshold > 0.0:
-        summary_df = summary_df[summary_df["Cost"] >= threshold]
+        # A plain NumPy mask skips aligning the mask's index with the frame.
+        summary_df = summary_df[summary_df["Cost"].to_numpy() >= threshold]
     return summary_df.reset_index(drop=True)  # type: ignore
 
 
@@ -342,6 +555,6 @@ def pivot_data(
     the specified row and column. This is primarily useful for human consumption.
     """
     summary = summarize_by_columns(df, [row_label, col_label], threshold)
-    return summary.pivot_table(
-        index=row_label, columns=col_label, values="Cost", aggfunc="sum"
-    ).fillna(0.0)
+    # The summary has one row per (row, col) pair, so no aggregation is needed.
+    # pivot sorts both axes, matching what pivot_table produced.
+    return summary.pivot(index=row_label, columns=col_label, values="Cost").fillna(0.0)
@@ -1,5 +1,6 @@
-from functools import reduce
+import weakref
 
+import numpy as np
 import pandas as pd
 
 
@@ -7,15 +8,64 @@ def column_cost_summary(raw_df: pd.DataFrame, col: str) -> pd.DataFrame:
     """
     Generates a simple summary cost report aggregated by some column.
     """
-    summary_df = raw_df.groupby([col], as_index=False)["Cost"].sum()
+    summary_df = raw_df.groupby([col], as_index=False, observed=True)["Cost"].sum()
     summary_df = summary_df.set_index(col)
+    # A categorical index would reject the relabelled "Untagged" row.
+    summary_df.index = summary_df.index.astype(object)
     summary_df.rename(index={"": "Untagged"}, inplace=True)
     summary_df = summary_df.sort_values(by="Cost", ascending=False)
     return summary_df
 
 
+# Pivots of the frames passed to generate_cost_report with cache_pivot, keyed by
+# the frame's id and the row label. Each entry keeps a weak reference to its
+# frame, to detect a recycled id, and is dropped once the frame is collected.
+# The key identifies the object, not its contents, so this assumes the frames
+# are never modified in place; one that is would get a stale pivot.
+_pivot_cache: dict[tuple[int, str], tuple[weakref.ref, pd.DataFrame]] = {}
+
+
+def _pivot_costs(raw_df: pd.DataFrame, row_label: str) -> pd.DataFrame:
+    """Sums Cost into a row_label by StartDate table, with 0 for missing pairs."""
+    # Build the pivot as a dense (row, date) matrix with a single bincount,
+    # rather than pivot_table.
+    row_codes, rows = pd.factorize(raw_df[row_label], sort=True)
+    date_codes, dates = pd.factorize(raw_df["StartDate"], sort=True)
+    costs = raw_df["Cost"].to_numpy(dtype=float)
+    # Like pivot_table, leave out rows with a missing label, date or cost.
+    valid = (row_codes >= 0) & (date_codes >= 0) & ~np.isnan(costs)
+    matrix = np.bincount(
+        row_codes[valid] * len(dates) + date_codes[valid],
+        weights=costs[valid],
+        minlength=len(rows) * len(dates),
+    ).reshape(len(rows), len(dates))
+    # Row labels may be categorical; the report adds "Other" and "Untagged"
+    # rows, which a categorical index would reject.
+    return pd.DataFrame(
+        matrix,
+        index=pd.Index(rows, name=row_label).astype(object),
+        columns=pd.Index(dates, name="StartDate"),
+    )
+
+
+def _cached_pivot_costs(raw_df: pd.DataFrame, row_label: str) -> pd.DataFrame:
+    key = (id(raw_df), row_label)
+    entry = _pivot_cache.get(key)
+    if entry is not None and entry[0]() is raw_df:
+        return entry[1]
+
+    pivoted_df = _pivot_costs(raw_df, row_label)
+    _pivot_cache[key] = (weakref.ref(raw_df), pivoted_df)
+    weakref.finalize(raw_df, _pivot_cache.pop, key, None)
+    return pivoted_df
+
+
 def generate_cost_report(
-    raw_df: pd.DataFrame, row_label: str, *, selector: int | list[str] | None = None
+    raw_df: pd.DataFrame,
+    row_label: str,
+    *,
+    selector: int | list[str] | None = None,
+    cache_pivot: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Generates a pivoted cost report, filtered a selection of rows per period,
@@ -24,41 +74,48 @@ def generate_cost_report(
 
     The selector can be either an int to specify the top N, or it can be a list
     of strings for the rows selected.
+
+    With cache_pivot, the pivot of raw_df is kept until raw_df is garbage
+    collected, so repeated reports on the same frame with different selectors
+    skip it. Only use it for frames that are not modified in place.
     """
     if raw_df.empty:
         return pd.DataFrame(), pd.DataFrame()
 
-    pivoted_df = raw_df.pivot_table(
-        index=row_label, columns="StartDate", values="Cost", aggfunc="sum"
-    ).fillna(0.0)
+    if cache_pivot:
+        pivoted_df = _cached_pivot_costs(raw_df, row_label)
+    else:
+        pivoted_df = _pivot_costs(raw_df, row_label)
 
     selected = pivoted_df.index.to_list()
     if isinstance(selector, int):
-        # Filter to include top N per column.
-        top_items: set[str] = set()
-        for column in pivoted_df.columns:
-            # Get the top N services for this specific date column
-            top_n_for_col = pivoted_df[column].nlargest(selector).index
-            top_items.update(top_n_for_col)
-        selected = list(top_items)
+        # Filter to include top N per column, sorting every column at once. A
+        # stable sort breaks ties at the cutoff by row order, like nlargest.
+        values = pivoted_df.to_numpy()
+        if selector <= 0:
+            selected = []
+        elif selector < len(values):
+            top = np.argsort(-values, axis=0, kind="stable")[:selector]
+            selected = pivoted_df.index[np.unique(top)].to_list()
     elif isinstance(selector, list):
-        selected = [i for i in selector if i in pivoted_df.index]
+        selected = pivoted_df.index.intersection(selector).to_list()
 
     if not selected:
         raise RuntimeError("No rows selected")
     # Compose the pivot table with Other row.
     report_df = pivoted_df.loc[selected].copy()
-    totals = raw_df.groupby("StartDate")["Cost"].sum()
-    sub_totals = report_df.sum(axis=0)
-    remainders = totals - sub_totals
-    remainders = remainders.where(remainders.abs() >= 0.01, 0)
-    if not (remainders == 0).all():
-        report_df.loc["Other"] = remainders
-
-    # Sort rows by the latest date column (descending).
+    totals = pivoted_df.sum(axis=0)
+    # Both sides share the same date columns, so work on the raw arrays.
+    remainders = totals.to_numpy() - report_df.to_numpy().sum(axis=0)
+    significant = np.abs(remainders) >= 0.01
+    if significant.any():
+        report_df.loc["Other"] = np.where(significant, remainders, 0.0)
+
+    # Sort rows by the latest date column (descending). A stable argsort on the
+    # raw array skips sort_values' dispatch, and keeps ties in a fixed order.
     if not report_df.empty:
-        latest_col = report_df.columns[-1]
-        report_df = report_df.sort_values(by=latest_col, ascending=False)
+        latest = report_df.iloc[:, -1].to_numpy()
+        report_df = report_df.take(np.argsort(-latest, kind="stable"))
         report_df.rename(index={"": "Untagged"}, inplace=True)
 
     # Add a Total row by summing the original raw_df.
@@ -97,18 +154,18 @@ def filter_preserve_date_range(
     """
     # First pick out all the unique dates
     date_cols = ["StartDate", "EndDate"]
-    all_dates = df[date_cols].drop_duplicates()
+    all_dates = df[date_cols].drop_duplicates(ignore_index=True)
 
-    # Filter the rows we want and figure out the missing dates
-    criteria = [(df[col] == val) for col, val in filters.items()]
-    mask = reduce(lambda x, y: x & y, criteria)
+    # Filter the rows we want and figure out the missing dates. With no filters
+    # every row is kept.
+    mask = np.ones(len(df), dtype=bool)
+    for col, val in filters.items():
+        mask &= (df[col] == val).to_numpy(dtype=bool, na_value=False)
     filtered_df = df[mask].reset_index(drop=True)
-    filtered_dates = filtered_df[date_cols].drop_duplicates()
 
-    missing_dates = all_dates.merge(filtered_dates, how="left", indicator=True)
-    missing_dates = missing_dates[missing_dates["_merge"] == "left_only"].drop(
-        columns="_merge"
-    )
+    # A set difference on the date pairs; cheaper than a merge with indicator.
+    filtered_dates = pd.MultiIndex.from_frame(filtered_df[date_cols])
+    missing_dates = all_dates[~pd.MultiIndex.from_frame(all_dates).isin(filtered_dates)]
 
     # Now create some a set of the filler rows with the missing dates.
     filler_df = pd.concat([df.iloc[:0], missing_dates])
@@ -119,9 +176,10 @@ def filter_preserve_date_range(
         # Everything else we just fill in empty string
         filler_df[c] = default_vals.get(c, "")
 
-    # Assemble the final thing.
-    final_df = pd.concat([filler_df, filtered_df]).sort_values(
-        by="StartDate", ascending=True
-    )
+    # Assemble the final thing. Skip an empty filler, since concatenating it
+    # with categorical columns is deprecated in pandas.
+    if not filler_df.empty:
+        filtered_df = pd.concat([filler_df, filtered_df])
+    final_df = filtered_df.sort_values(by="StartDate", ascending=True)
 
     return final_df
@@ -0,0 +1,34 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter. It allows bursts of up to `burst`
+    calls, and sustains `rate` calls per second after that. Callers only sleep
+    when the bucket is empty.
+    """
+
+    def __init__(self, *, rate: float, burst: int):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst must be >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Takes one token, blocking until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._last = now
+            # Reserve the token even if it is not there yet, so that concurrent
+            # callers queue up behind each other instead of all waking at once.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.cache/aws-cost-tool")
+
+# Cost data for the current month keeps changing, but CE itself only refreshes
+# a few times a day, so match the app's in-memory cache lifetime.
+OPEN_PERIOD_TTL = 14400
+
+# AWS keeps revising the previous month (credits, refunds, late usage) for a
+# few days after it ends, so a month is only treated as final after this.
+CLOSE_GRACE_DAYS = 5
+
+
+def _is_closed(params: dict[str, Any], today: date) -> bool:
+    """
+    True if the request only covers months that ended at least CLOSE_GRACE_DAYS
+    ago.
+    """
+    end = date.fromisoformat(params["TimePeriod"]["End"])
+    return end <= (today - timedelta(days=CLOSE_GRACE_DAYS)).replace(day=1)
+
+
+class ResponseCache:
+    """
+    An on-disk cache of paginated get_cost_and_usage responses, keyed by the
+    request parameters. Data for months that have ended no longer changes, so
+    it is kept forever; anything touching the current month expires after
+    open_ttl seconds.
+
+    Entries don't record which account they came from, so give each AWS profile
+    its own directory.
+    """
+
+    def __init__(
+        self, directory: Path = DEFAULT_CACHE_DIR, *, open_ttl: float = OPEN_PERIOD_TTL
+    ):
+        # The directory is only created on the first put, so an unwritable
+        # location just means nothing gets cached.
+        self.directory = directory.expanduser()
+        self.open_ttl = open_ttl
+
+    def _path(self, params: dict[str, Any]) -> Path:
+        key = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _load(path: Path) -> dict[str, Any] | None:
+        """Reads a cache entry, or returns None if it is missing or unreadable."""
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring corrupt cache entry {path.name}: {e}")
+            return None
+
+        if not isinstance(entry, dict):
+            logger.warning(f"Ignoring corrupt cache entry {path.name}")
+            return None
+        return entry
+
+    @staticmethod
+    def _discard(path: Path):
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove cache entry {path.name}: {e}")
+
+    def get(self, params: dict[str, Any]) -> list[dict[str, Any]] | None:
+        """
+        Returns the cached pages for params, or None on a miss. An expired or
+        damaged entry is deleted as it is found.
+        """
+        path = self._path(params)
+        entry = self._load(path)
+        if entry is None:
+            return None
+
+        expires = entry.get("expires")
+        expired = expires is not None and time.time() >= expires
+        pages = entry.get("pages")
+        if expired or not isinstance(pages, list):
+            self._discard(path)
+            return None
+        return pages
+
+    def put(self, params: dict[str, Any], pages: list[dict[str, Any]]):
+        """Stores the pages fetched for params."""
+        expires = (
+            None if _is_closed(params, date.today()) else time.time() + self.open_ttl
+        )
+        # The response metadata is per request and not worth keeping.
+        pages = [
+            {k: v for k, v in page.items() if k != "ResponseMetadata"} for page in pages
+        ]
+        path = self._path(params)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"expires": expires, "pages": pages}, f)
+            # Replace atomically, so a concurrent reader never sees half a file.
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path.name}: {e}")
+
+    def clear(self, *, open_only: bool = False):
+        """
+        Removes cached entries. With open_only, only the entries that can still
+        change (those with an expiry) are removed.
+        """
+        for path in self.directory.glob("*.json"):
+            if open_only:
+                entry = self._load(path)
+                if entry is not None and entry.get("expires") is None:
+                    continue
+            path.unlink(missing_ok=True)
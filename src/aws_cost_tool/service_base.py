@@ -2,25 +2,37 @@ import re
 import unicodedata
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping
-from functools import reduce
+from functools import cached_property, lru_cache
 
+import numpy as np
 import pandas as pd
 
 type Extractor = Callable[[pd.DataFrame], pd.DataFrame]
 
+# Detect region prefix: 2-3 letters, follows by digit and a hyphen.
+_REGION_PREFIX_RE = re.compile(r"^[a-zA-Z]{2}(?:[a-zA-Z]+)?\d-")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
+
+@lru_cache(maxsize=256)
 def slugify_name(name: str) -> str:
     """
     Normalizes a string to be filesystem-friendly:
     lowercase, no spaces, no special characters.
     """
-    # Convert to lowercase and normalize unicode (e.g., convert 'é' to 'e')
+    # Convert to lowercase and normalize unicode (e.g., convert 'é' to 'e').
+    # Service names are almost always ASCII already, which needs no work.
     text = name.lower()
-    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    if not text.isascii():
+        text = (
+            unicodedata.normalize("NFKD", text)
+            .encode("ascii", "ignore")
+            .decode("ascii")
+        )
 
     # Replace any non-alphanumeric characters with a hyphen
     # [^a-z0-9]+ matches any sequence of characters that AREN'T a-z or 0-9
-    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = _NON_ALNUM_RE.sub("-", text)
 
     # Remove leading/trailing hyphens
     return text.strip("-")
@@ -35,7 +47,7 @@ class ServiceBase(ABC):
         """
         The display name of the service used by Cost Explorer. It is also used
         to as a filter in the API call, so it has to match exactly what Cost
-        Explorer returns.
+        Explorer returns. Subclasses normally set it as a class constant.
         """
         ...
 
@@ -45,7 +57,7 @@ class ServiceBase(ABC):
         """The display name of the service"""
         ...
 
-    @property
+    @cached_property
     def file_prefix(self) -> str:
         """
         Normalizes a string to be filesystem-friendly:
@@ -75,12 +87,23 @@ class ServiceBase(ABC):
         if df.empty:
             return pd.DataFrame()
 
-        # First filter out rows with cost below min_cost.
-        df = df[df["Cost"] >= min_cost]
+        # First filter out rows with cost below min_cost. Even a min_cost of 0
+        # drops credits, so always check, but skip the copy if nothing goes.
+        keep = df["Cost"].to_numpy() >= min_cost
+        if not keep.all():
+            df = df[keep]
+        # Usage types repeat a lot. As a categorical, the extractors' str
+        # methods only look at each distinct value once. Frames from Cost
+        # Explorer already come this way, but other sources may not.
+        if "Usage_type" in df and not isinstance(
+            df["Usage_type"].dtype, pd.CategoricalDtype
+        ):
+            df = df.astype({"Usage_type": "category"})
         groups = {key: func(df) for key, func in extractors.items()}
-        indices = [df.index for df in groups.values()]
-        union_index = reduce(lambda x, y: x.union(y), indices)
-        other_index = df.index.difference(union_index)
+        # One membership test against all the extracted labels, rather than
+        # folding pairwise Index unions.
+        extracted = [group.index.to_numpy() for group in groups.values()]
+        other_index = df.index[~df.index.isin(np.concatenate(extracted or [[]]))]
         if not other_index.empty:
             other_df = df.loc[other_index]
             other_df["Subtype"] = "Other"
@@ -97,6 +120,10 @@ class ServiceBase(ABC):
         Many Usage_type returned has a region prefix. This function strips it to
         aid aggregation.
         """
-        # Detect region prefix: 2-3 letters, follows by digit and a hyphen.
-        region_pattern = r"^[a-zA-Z]{2}(?:[a-zA-Z]+)?\d-"
-        df["Usage_type"] = df["Usage_type"].str.replace(region_pattern, "", regex=True)
+        # Extractors often match nothing. An empty slice of a categorical still
+        # carries every category, so don't rewrite them all for no rows.
+        if df.empty:
+            return
+        df["Usage_type"] = df["Usage_type"].str.replace(
+            _REGION_PREFIX_RE, "", regex=True
+        )
@@ -1,6 +1,6 @@
 import importlib
-import inspect
 import pkgutil
+from types import ModuleType
 
 from aws_cost_tool.service_base import ServiceBase, slugify_name
 
@@ -34,17 +34,28 @@ def load_services(package_name: str = "services") -> None:
         full_module_name = f"{package_name}.{module_name}"
         module = importlib.import_module(full_module_name)
 
-        # Look for classes inside the module
-        for _name, obj in inspect.getmembers(module, inspect.isclass):
-            # Check if it's a subclass of our base, but NOT the base itself
-            if issubclass(obj, ServiceBase) and obj is not ServiceBase:
-                instance = obj()
-                tmp_registry[instance.name] = instance
+        for cls in _service_classes(module):
+            instance = cls()
+            tmp_registry[instance.name] = instance
 
     # Ensure that the final registry is sorted by the name.
     _registry = {k: tmp_registry[k] for k in sorted(tmp_registry.keys())}
 
 
+def _service_classes(module: ModuleType) -> list[type[ServiceBase]]:
+    """Returns every ServiceBase subclass in a module's namespace."""
+    # Scan the namespace directly; inspect.getmembers would sort dir(module)
+    # and look up every attribute first.
+    return [
+        obj
+        for obj in vars(module).values()
+        # Check if it's a subclass of our base, but NOT the base itself
+        if isinstance(obj, type)
+        and issubclass(obj, ServiceBase)
+        and obj is not ServiceBase
+    ]
+
+
 def services_names() -> list[str]:
     """Returns the list of all the services found."""
     return list(_registry.keys())
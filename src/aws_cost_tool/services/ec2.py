@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 import pandas as pd
 
 from aws_cost_tool.service_base import ServiceBase
@@ -39,15 +41,8 @@ EC2_EXTRACTOR = {
 
 
 class EC2(ServiceBase):
-    @property
-    def name(self) -> str:
-        """The display name of the service used by Cost Explorer."""
-        return "Amazon Elastic Compute Cloud - Compute"
-
-    @property
-    def shortname(self) -> str:
-        """The display name of the service"""
-        return "EC2"
+    name: ClassVar[str] = "Amazon Elastic Compute Cloud - Compute"
+    shortname: ClassVar[str] = "EC2"
 
     def categorize_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """Logic to create a multi-index the dataframe with categorized usage"""
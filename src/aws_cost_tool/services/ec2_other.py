@@ -1,91 +1,129 @@
+import re
+from functools import partial
+from typing import ClassVar
+
 import numpy as np
 import pandas as pd
 
 from aws_cost_tool.service_base import ServiceBase
 
+# One pattern for all the categories, so Usage_type is scanned once. Each named
+# group captures the usage type without its region prefix, and tells which
+# category matched. EBSOptimized has no "EBS:" so it is left out.
+_USAGE_RE = re.compile(
+    r"(?P<ebs>EBS:.*)"
+    r"|(?P<nat>(?i:NatGateway).*)"
+    r"|(?P<dt>(?i:DataTransfer).*)"
+    r"|(?P<vpc>(?i:VpcPeering).*)"
+)
+_EBS_VOLUME_RE = re.compile("VolumeUsage", re.IGNORECASE)
+_EBS_SNAPSHOT_RE = re.compile("SnapshotUsage", re.IGNORECASE)
+_EBS_THROUGHPUT_RE = re.compile("Throughput|IOPS", re.IGNORECASE)
+_NAT_HOURS_RE = re.compile("Hours", re.IGNORECASE)
+_NAT_BYTES_RE = re.compile("Bytes", re.IGNORECASE)
+
+
+def _classify_usage_types(
+    usage_types: pd.Series,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the (usage type, category, subtype) arrays for each entry. Unmatched
+    entries get an empty category.
+    """
+    parts = usage_types.str.extract(_USAGE_RE)
+    is_ebs = parts["ebs"].notna()
+    is_nat = parts["nat"].notna()
+    is_dt = parts["dt"].notna() | parts["vpc"].notna()
+    # Only one group matches per row, so the first non-null is the usage type.
+    usage = parts.bfill(axis=1).iloc[:, 0].fillna("").astype(str)
+
+    # Add a column to categorize the rows further.
+    conditions = [
+        is_ebs & usage.str.contains(_EBS_VOLUME_RE),
+        is_ebs & usage.str.contains(_EBS_SNAPSHOT_RE),
+        is_ebs & usage.str.contains(_EBS_THROUGHPUT_RE),
+        is_nat & usage.str.contains(_NAT_HOURS_RE),
+        is_nat & usage.str.contains(_NAT_BYTES_RE),
+        is_dt,
+    ]
+    choices = [
+        "EBS Volume",
+        "EBS Snapshot",
+        "EBS Throughput",
+        "NAT Gateway Hours",
+        "NAT Gateway Bytes",
+        "Data Transfer",
+    ]
+    category = np.select(
+        [is_ebs, is_nat, is_dt], ["EBS", "VPC", "Data Transfer"], default=""
+    )
+    subtype = np.select(conditions, choices, default="Other")
+    return usage.to_numpy(), category, subtype
 
-def extract_ebs_costs(df: pd.DataFrame) -> pd.DataFrame:
+
+def classify_ec2_other_usage(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Extracts EBS costs broken down by Region and classifies the type of spending.
-    It assuming the input is a DataFrame returned by fetch_service_costs_by_usage
-    for "EC2 - Other" service.
-    This extraction function preserves the original index so it can be used for
-    subtraction with the original DataFrame later
+    Classifies "EC2 - Other" usage in a single pass. It assuming the input is a
+    DataFrame returned by fetch_service_costs_by_usage for "EC2 - Other" service.
+    Returns the EBS, NAT Gateway and data transfer rows with the region prefix
+    removed from Usage_type, plus Category and Subtype columns. Everything else
+    is left out.
+    The original index is preserved so it can be used for subtraction with the
+    original DataFrame later
     """
     if df.empty:
         return df
 
-    # Filter for EBS rows and remove region prefix from the type label.
-    df = df[df["Cost"] > 0.001]
-    mask = df.Usage_type.str.contains("EBS") & ~df.Usage_type.str.contains(
-        "EBSOptimized"
+    # There are only a few dozen distinct usage types, so run the regexes over
+    # those and broadcast the results back to the rows through the codes.
+    codes, uniques = pd.factorize(df["Usage_type"], use_na_sentinel=False)
+    usage, category, subtype = _classify_usage_types(
+        pd.Series(np.asarray(uniques, dtype=object))
     )
-    ebs_df = df[mask].copy()
-    ebs_df["Usage_type"] = ebs_df["Usage_type"].str.extract(r"(EBS:.*)")
 
-    # Add a column to categorize the rows.
-    conditions = [
-        ebs_df["Usage_type"].str.contains("VolumeUsage", case=False),
-        ebs_df["Usage_type"].str.contains("SnapshotUsage", case=False),
-        ebs_df["Usage_type"].str.contains("Throughput|IOPS", case=False),
-    ]
+    # Apply the cost threshold together with the match, so the frame is only
+    # sliced once.
+    keep = (df["Cost"].to_numpy() > 0.001) & (category[codes] != "")
+    result = df[keep].copy()
+    kept_codes = codes[keep]
+    result["Usage_type"] = usage[kept_codes]
+    result["Category"] = category[kept_codes]
+    result["Subtype"] = subtype[kept_codes]
+    return result
 
-    choices = ["EBS Volume", "EBS Snapshot", "EBS Throughput"]
-    ebs_df["Subtype"] = np.select(conditions, choices, default="Other")
-    return ebs_df
 
+def _select_category(
+    classified: pd.DataFrame, category: str, df: pd.DataFrame
+) -> pd.DataFrame:
+    """The rows of df that classify_ec2_other_usage put in category."""
+    if classified.empty:
+        return classified
+    rows = classified[classified["Category"] == category]
+    return rows.loc[rows.index.intersection(df.index)].drop(columns="Category")
 
-def extract_nat_gateway_costs(df: pd.DataFrame) -> pd.DataFrame:
+
+def extract_ebs_costs(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Extracts NAT Gateway costs broken down by Region and cost type (hours vs data
-    processed).
-    It assuming the input is a DataFrame returned by fetch_service_costs_by_usage
-    for "EC2 - Other" service.
-    This extraction function preserves the original index so it can be used for
-    subtraction with the original DataFrame later
+    Extracts EBS costs broken down by Region and classifies the type of spending.
+    See classify_ec2_other_usage.
     """
-    if df.empty:
-        return df
+    return _select_category(classify_ec2_other_usage(df), "EBS", df)
 
-    # Filter for NAT Gateway usage types
-    df = df[df["Cost"] > 0.001]
-    mask = df["Usage_type"].str.contains("NatGateway", case=False, na=False)
-    nat_df = df[mask].copy()
-    nat_df["Usage_type"] = nat_df["Usage_type"].str.extract(r"(NatGateway.*)")
 
-    # Add a column to categorize the rows.
-    conditions = [
-        nat_df["Usage_type"].str.contains("Hours", case=False),
-        nat_df["Usage_type"].str.contains("Bytes", case=False),
-    ]
-
-    choices = ["NAT Gateway Hours", "NAT Gateway Bytes"]
-    nat_df["Subtype"] = np.select(conditions, choices, default="Other")
-    return nat_df
+def extract_nat_gateway_costs(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Extracts NAT Gateway costs broken down by Region and cost type (hours vs data
+    processed). See classify_ec2_other_usage.
+    """
+    return _select_category(classify_ec2_other_usage(df), "VPC", df)
 
 
 def extract_data_transfer_costs(df: pd.DataFrame) -> pd.DataFrame:
     """
     Extracts data transfer costs broken down by Region and transfer type.
-    It assuming the input is a DataFrame returned by fetch_service_costs_by_usage
-    for "EC2 - Other" service.
-    This extraction function preserves the original index so it can be used for
-    subtraction with the original DataFrame later
+    See classify_ec2_other_usage.
     """
-    if df.empty:
-        return df
-
-    # Filter for Data Transfer and VPC usage types
-    df = df[df["Cost"] > 0.001]
-    mask = df["Usage_type"].str.contains("DataTransfer", case=False, na=False)
-    dt_df = df[mask].copy()
-    dt_df["Usage_type"] = dt_df["Usage_type"].str.extract(r"(DataTransfer.*)")
-    mask = df["Usage_type"].str.contains("VpcPeering", case=False, na=False)
-    vpc_df = df[mask].copy()
-    vpc_df["Usage_type"] = vpc_df["Usage_type"].str.extract(r"(VpcPeering.*)")
-    full_dt_df = pd.concat([dt_df, vpc_df])
-    full_dt_df["Subtype"] = "Data Transfer"
-    return full_dt_df
+    return _select_category(classify_ec2_other_usage(df), "Data Transfer", df)
 
 
 EC2_OTHER_EXTRACTOR = {
@@ -96,16 +134,16 @@ EC2_OTHER_EXTRACTOR = {
 
 
 class EC2Other(ServiceBase):
-    @property
-    def name(self) -> str:
-        """The display name of the service used by Cost Explorer."""
-        return "EC2 - Other"
-
-    @property
-    def shortname(self) -> str:
-        """The display name of the service"""
-        return "EC2 Other"
+    name: ClassVar[str] = "EC2 - Other"
+    shortname: ClassVar[str] = "EC2 Other"
 
     def categorize_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """Logic to create a multi-index the dataframe with categorized usage"""
-        return self.categorize_usage_costs(df, extractors=EC2_OTHER_EXTRACTOR)
+        # Classify every row once; each extractor then only picks out its rows
+        # instead of scanning Usage_type again.
+        classified = classify_ec2_other_usage(df)
+        extractors = {
+            category: partial(_select_category, classified, category)
+            for category in EC2_OTHER_EXTRACTOR
+        }
+        return self.categorize_usage_costs(df, extractors=extractors)
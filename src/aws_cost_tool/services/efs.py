@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 import pandas as pd
 
 from aws_cost_tool.service_base import ServiceBase
@@ -40,15 +42,8 @@ EFS_EXTRACTOR = {
 
 
 class EFS(ServiceBase):
-    @property
-    def name(self) -> str:
-        """The display name of the service used by Cost Explorer."""
-        return "Amazon Elastic File System"
-
-    @property
-    def shortname(self) -> str:
-        """The display name of the service"""
-        return "EFS"
+    name: ClassVar[str] = "Amazon Elastic File System"
+    shortname: ClassVar[str] = "EFS"
 
     def categorize_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """Logic to create a multi-index the dataframe with categorized usage"""
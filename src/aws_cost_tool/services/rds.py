@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 import pandas as pd
 
 from aws_cost_tool.service_base import ServiceBase
@@ -11,7 +13,9 @@ def extract_backup_costs(df: pd.DataFrame) -> pd.DataFrame:
     later.
     """
     if not df.empty:
-        mask = df["Usage_type"].str.contains("BackupUsage", case=False, na=False)
+        mask = df["Usage_type"].str.contains(
+            "BackupUsage", case=False, na=False, regex=False
+        )
         df = df[mask].copy()
         ServiceBase.strip_region_prefix_from_usage(df)
         df["Subtype"] = "Backup"
@@ -26,7 +30,9 @@ def extract_storage_costs(df: pd.DataFrame) -> pd.DataFrame:
     later.
     """
     if not df.empty:
-        mask = df["Usage_type"].str.contains("Storage", case=False, na=False)
+        mask = df["Usage_type"].str.contains(
+            "Storage", case=False, na=False, regex=False
+        )
         df = df[mask].copy()
         ServiceBase.strip_region_prefix_from_usage(df)
         df["Subtype"] = "Storage"
@@ -41,9 +47,10 @@ def extract_compute_costs(df: pd.DataFrame) -> pd.DataFrame:
     later.
     """
     if not df.empty:
-        mask = df["Usage_type"].str.contains(
-            r"InstanceUsage|Serverless", case=False, na=False
-        )
+        usage = df["Usage_type"]
+        mask = usage.str.contains(
+            "InstanceUsage", case=False, na=False, regex=False
+        ) | usage.str.contains("Serverless", case=False, na=False, regex=False)
         df = df[mask].copy()
         ServiceBase.strip_region_prefix_from_usage(df)
         df["Subtype"] = "Compute"
@@ -73,15 +80,8 @@ RDS_EXTRACTOR = {
 
 
 class RDS(ServiceBase):
-    @property
-    def name(self) -> str:
-        """The display name of the service used by Cost Explorer."""
-        return "Amazon Relational Database Service"
-
-    @property
-    def shortname(self) -> str:
-        """The display name of the service"""
-        return "RDS"
+    name: ClassVar[str] = "Amazon Relational Database Service"
+    shortname: ClassVar[str] = "RDS"
 
     def categorize_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """Logic to create a multi-index the dataframe with categorized usage"""
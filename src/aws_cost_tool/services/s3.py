@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 import pandas as pd
 
 from aws_cost_tool.service_base import ServiceBase
@@ -11,7 +13,9 @@ def extract_storage_costs(df: pd.DataFrame) -> pd.DataFrame:
     later.
     """
     if not df.empty:
-        mask = df["Usage_type"].str.contains("TimedStorage", case=False, na=False)
+        mask = df["Usage_type"].str.contains(
+            "TimedStorage", case=False, na=False, regex=False
+        )
         df = df[mask].copy()
         ServiceBase.strip_region_prefix_from_usage(df)
         df["Subtype"] = "Storage"
@@ -26,7 +30,9 @@ def extract_request_costs(df: pd.DataFrame) -> pd.DataFrame:
     later.
     """
     if not df.empty:
-        mask = df["Usage_type"].str.contains("Requests-Tier", case=False, na=False)
+        mask = df["Usage_type"].str.contains(
+            "Requests-Tier", case=False, na=False, regex=False
+        )
         df = df[mask].copy()
         ServiceBase.strip_region_prefix_from_usage(df)
         df["Subtype"] = "Request"
@@ -55,15 +61,8 @@ S3_EXTRACTOR = {
 
 
 class S3(ServiceBase):
-    @property
-    def name(self) -> str:
-        """The display name of the service used by Cost Explorer."""
-        return "Amazon Simple Storage Service"
-
-    @property
-    def shortname(self) -> str:
-        """The display name of the service"""
-        return "S3"
+    name: ClassVar[str] = "Amazon Simple Storage Service"
+    shortname: ClassVar[str] = "S3"
 
     def categorize_usage(self, df: pd.DataFrame) -> pd.DataFrame:
         """Logic to create a multi-index the dataframe with categorized usage"""
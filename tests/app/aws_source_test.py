@@ -0,0 +1,66 @@
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+import app.aws_source as aws_source
+from app.aws_source import AWSCostSource, clear_cost_cache
+
+FETCH_ARGS: dict[str, Any] = {
+    "dates": "2025-01",
+    "cost_metric": "UnblendedCost",
+    "granularity": "MONTHLY",
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path):
+    """Each test gets empty in-memory caches and its own cache directory."""
+    aws_source.cost_cache.clear()
+    aws_source.response_caches.clear()
+    with (
+        patch("app.aws_source.create_ce_client"),
+        patch("app.aws_source.DEFAULT_CACHE_DIR", tmp_path),
+    ):
+        yield tmp_path
+    aws_source.cost_cache.clear()
+    aws_source.response_caches.clear()
+
+
+def test_profiles_get_separate_response_caches(isolated_caches):
+    a = AWSCostSource("account-a")
+    b = AWSCostSource("account-b")
+
+    assert a.response_cache is not None and b.response_cache is not None
+    assert a.response_cache.directory == isolated_caches / "account-a"
+    assert b.response_cache.directory == isolated_caches / "account-b"
+    # A later source for the same profile shares its cache.
+    assert AWSCostSource("account-a").response_cache is a.response_cache
+
+
+@patch("app.aws_source.ce.fetch_service_costs")
+def test_fetch_uses_own_profile_cache(mock_fetch):
+    a = AWSCostSource("account-a")
+    b = AWSCostSource("account-b")
+
+    a.fetch_service_costs(**FETCH_ARGS)
+    b.fetch_service_costs(**FETCH_ARGS)
+
+    # The same query is fetched once per profile, each through its own cache.
+    assert mock_fetch.call_count == 2
+    caches = [call.kwargs["response_cache"] for call in mock_fetch.call_args_list]
+    assert caches == [a.response_cache, b.response_cache]
+
+
+def test_no_disk_cache():
+    assert AWSCostSource("account-a", disk_cache=False).response_cache is None
+
+
+@patch("app.aws_source.ResponseCache.clear")
+def test_clear_cost_cache_clears_every_profile(mock_clear):
+    AWSCostSource("account-a")
+    AWSCostSource("account-b")
+
+    clear_cost_cache()
+
+    assert mock_clear.call_count == 2
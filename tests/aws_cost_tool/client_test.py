@@ -10,7 +10,21 @@ from botocore.exceptions import (
     UnauthorizedSSOTokenError,
 )
 
-from aws_cost_tool.client import check_aws_auth, create_ce_client, refresh_credentials
+from aws_cost_tool.client import (
+    CLIENT_CONFIG,
+    check_aws_auth,
+    clear_client_cache,
+    create_ce_client,
+    refresh_credentials,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_client_cache():
+    """Each test patches boto3.Session, so nothing may leak between tests."""
+    clear_client_cache()
+    yield
+    clear_client_cache()
 
 
 class TestCheckAwsAuth:
@@ -121,6 +135,78 @@ class TestCheckAwsAuth:
 
         assert exc_info.value.response["Error"]["Code"] == "AccessDenied"
 
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_success_is_cached(self, mock_session):
+        """A successful check is not repeated within the TTL."""
+        mock_sts = Mock()
+        mock_session.return_value.client.return_value = mock_sts
+
+        assert check_aws_auth("my-profile")
+        assert check_aws_auth("my-profile")
+
+        mock_sts.get_caller_identity.assert_called_once()
+
+    @patch("aws_cost_tool.client.time.monotonic")
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_cached_success_expires(self, mock_session, mock_monotonic):
+        """The check is repeated once the TTL has passed."""
+        mock_sts = Mock()
+        mock_session.return_value.client.return_value = mock_sts
+        mock_monotonic.side_effect = [0.0, 10_000.0, 10_000.0]
+
+        assert check_aws_auth()
+        assert check_aws_auth()
+
+        assert mock_sts.get_caller_identity.call_count == 2
+
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_failure_is_not_cached(self, mock_session):
+        """A failed check is always retried."""
+        mock_sts = Mock()
+        mock_sts.get_caller_identity.side_effect = [NoCredentialsError(), {}]
+        mock_session.return_value.client.return_value = mock_sts
+
+        assert not check_aws_auth()
+        assert check_aws_auth()
+
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_sts_client_is_reused(self, mock_session):
+        """Repeated checks reuse one STS client until a check fails."""
+        mock_sts = Mock()
+        mock_session.return_value.client.return_value = mock_sts
+
+        with patch("aws_cost_tool.client.AUTH_CACHE_TTL", 0):
+            assert check_aws_auth()
+            assert check_aws_auth()
+        assert mock_sts.get_caller_identity.call_count == 2
+        mock_session.return_value.client.assert_called_once()
+
+        mock_sts.get_caller_identity.side_effect = NoCredentialsError()
+        assert not check_aws_auth()
+        check_aws_auth()
+        assert mock_session.return_value.client.call_count == 2
+
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_failure_keeps_other_profiles(self, mock_session):
+        """A failed check only drops the cached session of its own profile."""
+        good_sts, bad_sts = Mock(), Mock()
+        bad_sts.get_caller_identity.side_effect = NoCredentialsError()
+        sessions = {"good": Mock(), "bad": Mock()}
+        sessions["good"].client.return_value = good_sts
+        sessions["bad"].client.return_value = bad_sts
+        mock_session.side_effect = lambda profile_name: sessions[profile_name]
+
+        assert check_aws_auth("good")
+        assert not check_aws_auth("bad")
+        assert check_aws_auth("good")
+
+        # The good profile's session and check were both kept.
+        assert [c.kwargs["profile_name"] for c in mock_session.call_args_list] == [
+            "good",
+            "bad",
+        ]
+        good_sts.get_caller_identity.assert_called_once()
+
 
 class TestRefreshCredentials:
     """Tests for refresh_credentials function."""
@@ -170,6 +256,19 @@ class TestRefreshCredentials:
             ["aws", "sso", "login", "--profile", "my-profile"], check=True
         )
 
+    @patch("aws_cost_tool.client.subprocess.run")
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_login_clears_cached_clients(self, mock_session, mock_run):
+        """Clients created before a login are rebuilt afterwards."""
+        mock_session.return_value.client.return_value = Mock()
+
+        with patch("aws_cost_tool.client.check_aws_auth", return_value=True):
+            create_ce_client()
+            refresh_credentials()
+            create_ce_client()
+
+        assert mock_session.call_count == 2
+
 
 class TestCreateCeClient:
     """Tests for create_ce_client function."""
@@ -186,7 +285,7 @@ class TestCreateCeClient:
         mock_check_auth.assert_called_once_with(None)
         mock_session.assert_called_once_with(profile_name=None)
         mock_session.return_value.client.assert_called_once_with(
-            "ce", region_name="us-east-1"
+            "ce", region_name="us-east-1", config=CLIENT_CONFIG
         )
         assert result == mock_ce_client
 
@@ -214,7 +313,7 @@ class TestCreateCeClient:
 
         mock_check_auth.assert_called_once_with(None)
         mock_session.return_value.client.assert_called_once_with(
-            "ce", region_name="eu-west-1"
+            "ce", region_name="eu-west-1", config=CLIENT_CONFIG
         )
         assert result == mock_ce_client
 
@@ -230,6 +329,34 @@ class TestCreateCeClient:
         mock_check_auth.assert_called_once_with("my-profile")
         mock_session.assert_called_once_with(profile_name="my-profile")
         mock_session.return_value.client.assert_called_once_with(
-            "ce", region_name="ap-south-1"
+            "ce", region_name="ap-south-1", config=CLIENT_CONFIG
         )
         assert result == mock_ce_client
+
+    @patch("aws_cost_tool.client.check_aws_auth")
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_create_client_is_cached(self, mock_session, mock_check_auth):
+        """Repeated calls reuse the same session and client."""
+        mock_session.return_value.client.return_value = Mock()
+
+        first = create_ce_client(profile_name="my-profile")
+        second = create_ce_client(profile_name="my-profile")
+
+        assert first is second
+        mock_session.assert_called_once_with(profile_name="my-profile")
+        mock_session.return_value.client.assert_called_once()
+
+    def test_client_config(self):
+        """The shared client config enables adaptive retries and keep-alive."""
+        assert CLIENT_CONFIG.retries == {"max_attempts": 10, "mode": "adaptive"}
+        assert CLIENT_CONFIG.max_pool_connections == 32
+        assert CLIENT_CONFIG.tcp_keepalive is True
+
+    @patch("aws_cost_tool.client.boto3.Session")
+    def test_create_client_single_session(self, mock_session):
+        """The auth check and the client share one session."""
+        mock_session.return_value.client.return_value = Mock()
+
+        create_ce_client(profile_name="my-profile")
+
+        mock_session.assert_called_once_with(profile_name="my-profile")
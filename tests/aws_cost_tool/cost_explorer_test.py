@@ -6,19 +6,43 @@ import pytest
 
 from aws_cost_tool.ce_types import DateRange
 from aws_cost_tool.cost_explorer import (
+    _fetch_by_region,
     _fetch_group_by_cost,
+    clear_metadata_cache,
+    clear_region_cache,
     fetch_active_regions,
     fetch_service_costs,
     fetch_service_costs_by_usage,
     get_all_aws_services,
     get_tag_keys,
     get_tags_for_key,
+    json_to_df,
     paginate_ce,
     pivot_data,
     summarize_by_columns,
 )
 
 
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    """Keep the shared CE rate limiter from pacing unit tests."""
+    with patch("aws_cost_tool.cost_explorer.CE_RATE_LIMITER") as limiter:
+        yield limiter
+
+
+def _periods(*groups: tuple[list[str], str]) -> list[dict]:
+    """A single-month ResultsByTime list with the given (keys, amount) groups."""
+    return [
+        {
+            "TimePeriod": {"Start": "2025-01-01", "End": "2025-01-31"},
+            "Groups": [
+                {"Keys": keys, "Metrics": {"UnblendedCost": {"Amount": amount}}}
+                for keys, amount in groups
+            ],
+        }
+    ]
+
+
 class TestDateRange:
     """Tests for DateRange class."""
 
@@ -66,6 +90,15 @@ class TestDateRange:
             "End": "2025-01-31",
         }
 
+    def test_to_time_period_built_once(self):
+        dr = DateRange.create(start="2025-01-01", end="2025-01-31")
+        assert dr.to_time_period() is dr.to_time_period()
+        # The cached dict does not take part in equality or hashing.
+        same = DateRange.create(start="2025-01-01", end="2025-01-31")
+        assert dr == same
+        assert hash(dr) == hash(same)
+        assert "_time_period" not in repr(dr)
+
     def test_from_days_explicit_end(self):
         # 10 days back from Nov 10
         dr = DateRange.from_days(10, end="2025-11-10")
@@ -95,6 +128,16 @@ class TestDateRange:
         dr = DateRange.from_months(2, end="2025-01-15")
         assert dr.start == date(2024, 11, 1)
 
+    def test_from_months_full_year(self):
+        # Dec 2025 back 12 months -> Dec 2024
+        dr = DateRange.from_months(12, end="2025-12-31")
+        assert dr.start == date(2024, 12, 1)
+
+    def test_from_months_multiple_years(self):
+        # Mar 2025 back 26 months -> Jan 2023
+        dr = DateRange.from_months(26, end="2025-03-15")
+        assert dr.start == date(2023, 1, 1)
+
     def test_from_months_default_today(self, mocker):
         end_date = date(2025, 2, 5)
         mocker.patch.object(DateRange, "_today", return_value=end_date)
@@ -188,6 +231,15 @@ class TestGetTagKeys:
 
         assert result == []
 
+    def test_is_memoized(self):
+        mock_client = Mock()
+        mock_client.get_tags.return_value = {"Tags": ["env"]}
+        dates = DateRange.create(start="2025-01-01", end="2025-01-31")
+
+        assert get_tag_keys(mock_client, dates=dates) == ["env"]
+        assert get_tag_keys(mock_client, dates=dates) == ["env"]
+        mock_client.get_tags.assert_called_once()
+
 
 class TestGetTagsForKey:
     """Tests for get_tags_for_key function."""
@@ -229,6 +281,68 @@ class TestGetTagsForKey:
 
         assert result == []
 
+    def test_multiple_pages(self):
+        mock_client = Mock()
+        mock_client.get_tags.side_effect = [
+            {"Tags": ["prod"], "NextPageToken": "token1"},
+            {"Tags": ["staging"]},
+        ]
+        dates = DateRange.create(start="2025-01-01", end="2025-01-31")
+
+        result = get_tags_for_key(mock_client, tag_key="env", dates=dates)
+
+        assert result == ["prod", "staging"]
+        assert mock_client.get_tags.call_args.kwargs["NextPageToken"] == "token1"
+
+    def test_each_page_is_rate_limited(self, no_rate_limit):
+        mock_client = Mock()
+        mock_client.get_tags.side_effect = [
+            {"Tags": ["prod"], "NextPageToken": "token1"},
+            {"Tags": ["staging"]},
+        ]
+        dates = DateRange.create(start="2025-01-01", end="2025-01-31")
+
+        get_tags_for_key(mock_client, tag_key="env", dates=dates)
+        assert no_rate_limit.acquire.call_count == 2
+
+        # A memoized lookup makes no call, so it takes no token.
+        get_tags_for_key(mock_client, tag_key="env", dates=dates)
+        assert no_rate_limit.acquire.call_count == 2
+
+    def test_is_memoized(self):
+        mock_client = Mock()
+        mock_client.get_tags.return_value = {"Tags": ["prod"]}
+        dates = DateRange.create(start="2025-01-01", end="2025-01-31")
+
+        first = get_tags_for_key(mock_client, tag_key="env", dates=dates)
+        second = get_tags_for_key(mock_client, tag_key="env", dates=dates)
+        assert first == second == ["prod"]
+        mock_client.get_tags.assert_called_once()
+
+        clear_metadata_cache()
+        get_tags_for_key(mock_client, tag_key="env", dates=dates)
+        assert mock_client.get_tags.call_count == 2
+
+    @patch("aws_cost_tool.cost_explorer.time.monotonic")
+    def test_memo_expires(self, mock_monotonic):
+        mock_client = Mock()
+        mock_client.get_tags.return_value = {"Tags": ["prod"]}
+        dates = DateRange.create(start="2025-01-01", end="2025-01-31")
+        mock_monotonic.side_effect = [0.0, 10.0, 10_000.0]
+
+        for _ in range(3):
+            get_tags_for_key(mock_client, tag_key="env", dates=dates)
+
+        assert mock_client.get_tags.call_count == 2
+
+    def test_errors_are_not_memoized(self):
+        mock_client = Mock()
+        mock_client.get_tags.side_effect = [Exception("API Error"), {"Tags": ["prod"]}]
+        dates = DateRange.create(start="2025-01-01", end="2025-01-31")
+
+        assert get_tags_for_key(mock_client, tag_key="env", dates=dates) == []
+        assert get_tags_for_key(mock_client, tag_key="env", dates=dates) == ["prod"]
+
 
 class TestPaginateCe:
     """Tests for paginate_ce function"""
@@ -258,6 +372,55 @@ class TestPaginateCe:
 
         assert len(results) == 3
         assert mock_client.get_cost_and_usage.call_count == 3
+        last_call = mock_client.get_cost_and_usage.call_args_list[-1]
+        assert last_call.kwargs["NextPageToken"] == "token2"
+        assert "NextPageToken" not in params
+
+    def test_paginate_ce_acquires_rate_limit_per_page(self, no_rate_limit):
+        mock_client = Mock()
+        mock_client.get_cost_and_usage.side_effect = [
+            {"ResultsByTime": [], "NextPageToken": "token1"},
+            {"ResultsByTime": []},
+        ]
+
+        list(paginate_ce(mock_client, {}))
+
+        assert no_rate_limit.acquire.call_count == 2
+
+
+class TestPaginateCeWithCache:
+    """Tests for paginate_ce with a response cache."""
+
+    @pytest.fixture
+    def response_cache(self):
+        return Mock()
+
+    def test_hit_skips_api(self, response_cache):
+        response_cache.get.return_value = [{"ResultsByTime": []}]
+        mock_client = Mock()
+
+        results = list(
+            paginate_ce(mock_client, {"Granularity": "MONTHLY"}, response_cache)
+        )
+
+        assert results == [{"ResultsByTime": []}]
+        mock_client.get_cost_and_usage.assert_not_called()
+        response_cache.put.assert_not_called()
+
+    def test_miss_stores_all_pages(self, response_cache):
+        response_cache.get.return_value = None
+        mock_client = Mock()
+        pages = [
+            {"ResultsByTime": [], "NextPageToken": "token1"},
+            {"ResultsByTime": []},
+        ]
+        mock_client.get_cost_and_usage.side_effect = pages
+        params = {"Granularity": "MONTHLY"}
+
+        results = list(paginate_ce(mock_client, params, response_cache))
+
+        assert results == pages
+        response_cache.put.assert_called_once_with(params, pages)
 
 
 class TestFetchActiveRegions:
@@ -290,6 +453,59 @@ class TestFetchActiveRegions:
 
         assert set(result) == {"us-east-1", "eu-west-1"}
 
+    def test_fetch_active_regions_all_periods(self):
+        """Regions only active in later periods are still found."""
+
+        def period(region: str, amount: str) -> dict:
+            return {
+                "Groups": [
+                    {
+                        "Keys": [region],
+                        "Metrics": {"UnblendedCost": {"Amount": amount}},
+                    }
+                ]
+            }
+
+        mock_client = Mock()
+        mock_client.get_cost_and_usage.return_value = {
+            "ResultsByTime": [
+                period("us-east-1", "100.0"),
+                period("eu-west-1", "20.0"),
+                # Below min_cost in each period, but not in total.
+                period("us-west-2", "0.006"),
+                period("us-west-2", "0.006"),
+            ]
+        }
+        dr = DateRange.create(start=date(2025, 1, 1), end=date(2025, 4, 1))
+        result = fetch_active_regions(mock_client, dr, "MONTHLY", min_cost=0.01)
+
+        assert result == ["us-east-1", "eu-west-1", "us-west-2"]
+
+    def test_fetch_active_regions_is_memoized(self):
+        mock_client = Mock()
+        mock_client.get_cost_and_usage.return_value = {
+            "ResultsByTime": [
+                {
+                    "Groups": [
+                        {
+                            "Keys": ["us-east-1"],
+                            "Metrics": {"UnblendedCost": {"Amount": "100.50"}},
+                        },
+                    ]
+                }
+            ]
+        }
+        dr = DateRange.create(start=date(2025, 1, 1), end=date(2025, 1, 31))
+
+        first = fetch_active_regions(mock_client, dr, "MONTHLY", 0.01)
+        second = fetch_active_regions(mock_client, dr, "MONTHLY", 0.01)
+        assert first == second == ["us-east-1"]
+        mock_client.get_cost_and_usage.assert_called_once()
+
+        clear_region_cache()
+        fetch_active_regions(mock_client, dr, "MONTHLY", 0.01)
+        assert mock_client.get_cost_and_usage.call_count == 2
+
 
 class TestFetchServiceCost:
     """Tests for fetch_service_cost function"""
@@ -333,31 +549,14 @@ class TestFetchServiceCost:
         assert result["Cost"].sum() == pytest.approx(126.25)
 
     @patch("aws_cost_tool.cost_explorer.fetch_active_regions")
-    @patch("aws_cost_tool.cost_explorer._fetch_group_by_cost")
-    @patch("time.sleep")
-    def test_fetch_service_cost_with_tag(self, mock_sleep, mock_fetch, mock_regions):
+    @patch("aws_cost_tool.cost_explorer._fetch_periods")
+    def test_fetch_service_cost_with_tag(self, mock_fetch, mock_regions):
         mock_client = Mock()
         mock_regions.return_value = ["us-east-1", "us-west-2"]
-
-        df1 = pd.DataFrame(
-            {
-                "StartDate": [date(2025, 1, 1)],
-                "EndDate": [date(2025, 1, 31)],
-                "Service": ["Amazon EC2"],
-                "Environment": ["Environment$prod"],
-                "Cost": [100.0],
-            }
-        )
-        df2 = pd.DataFrame(
-            {
-                "StartDate": [date(2025, 1, 1)],
-                "EndDate": [date(2025, 1, 31)],
-                "Service": ["Amazon S3"],
-                "Environment": ["Environment$dev"],
-                "Cost": [50.0],
-            }
-        )
-        mock_fetch.side_effect = [df1, df2]
+        mock_fetch.side_effect = [
+            _periods((["Amazon EC2", "Environment$prod"], "100.0")),
+            _periods((["Amazon S3", "Environment$dev"], "50.0")),
+        ]
 
         dates = DateRange.create(start="2025-01-01", end="2025-01-31")
         result = fetch_service_costs(
@@ -372,7 +571,11 @@ class TestFetchServiceCost:
         assert "Region" in result.columns
         assert "Tag" in result.columns
         assert "Environment" not in result.columns
-        assert mock_sleep.call_count == 2
+        assert list(result["Region"]) == ["us-east-1", "us-west-2"]
+        assert list(result["Tag"]) == ["prod", "dev"]
+        # The regions are combined before the frame is built, so the group keys
+        # stay categorical.
+        assert isinstance(result["Region"].dtype, pd.CategoricalDtype)
 
 
 class TestFetchServiceCostsByUsage:
@@ -410,33 +613,14 @@ class TestFetchServiceCostsByUsage:
         assert "Usage_type" in result.columns
 
     @patch("aws_cost_tool.cost_explorer.fetch_active_regions")
-    @patch("aws_cost_tool.cost_explorer._fetch_group_by_cost")
-    @patch("time.sleep")
-    def test_fetch_service_costs_by_usage_with_tag(
-        self, mock_sleep, mock_fetch, mock_regions
-    ):
+    @patch("aws_cost_tool.cost_explorer._fetch_periods")
+    def test_fetch_service_costs_by_usage_with_tag(self, mock_fetch, mock_regions):
         mock_client = Mock()
         mock_regions.return_value = ["us-east-1", "us-west-2"]
-
-        df1 = pd.DataFrame(
-            {
-                "StartDate": [date(2025, 1, 1)],
-                "EndDate": [date(2025, 1, 31)],
-                "Usage_type": ["BoxUsage:t2.micro"],
-                "Environment": ["Environment$prod"],
-                "Cost": [50.0],
-            }
-        )
-        df2 = pd.DataFrame(
-            {
-                "StartDate": [date(2025, 1, 1)],
-                "EndDate": [date(2025, 1, 31)],
-                "Usage_type": ["BoxUsage:t2.small"],
-                "Environment": ["Environment$dev"],
-                "Cost": [25.0],
-            }
-        )
-        mock_fetch.side_effect = [df1, df2]
+        mock_fetch.side_effect = [
+            _periods((["BoxUsage:t2.micro", "Environment$prod"], "50.0")),
+            _periods((["BoxUsage:t2.small", "Environment$dev"], "25.0")),
+        ]
 
         dates = DateRange.create(start="2025-01-01", end="2025-01-31")
         result = fetch_service_costs_by_usage(
@@ -453,13 +637,123 @@ class TestFetchServiceCostsByUsage:
         assert "Tag" in result.columns
         assert "Usage_type" in result.columns
         assert "Environment" not in result.columns
-        assert mock_sleep.call_count == 2
-        # Verify the tag prefix was stripped
-        assert all(not tag.startswith("Environment$") for tag in result["Tag"])
+        assert set(result["Tag"]) == {"prod", "dev"}
         # Verify service filter was applied to both regions
         assert mock_fetch.call_count == 2
 
 
+class TestJsonToDf:
+    """Tests for json_to_df function."""
+
+    GROUP_BY = [
+        {"Type": "DIMENSION", "Key": "SERVICE"},
+        {"Type": "DIMENSION", "Key": "REGION"},
+    ]
+
+    def test_multiple_periods(self):
+        response = {
+            "ResultsByTime": [
+                {
+                    "TimePeriod": {"Start": "2025-01-01", "End": "2025-02-01"},
+                    "Groups": [
+                        {
+                            "Keys": ["Amazon EC2", "us-east-1"],
+                            "Metrics": {"UnblendedCost": {"Amount": "10.5"}},
+                        },
+                        {
+                            "Keys": ["Amazon S3", "us-west-2"],
+                            "Metrics": {"UnblendedCost": {"Amount": "2"}},
+                        },
+                    ],
+                },
+                {
+                    "TimePeriod": {"Start": "2025-02-01", "End": "2025-03-01"},
+                    "Groups": [
+                        {
+                            "Keys": ["Amazon EC2", "us-east-1"],
+                            "Metrics": {"UnblendedCost": {"Amount": "7.25"}},
+                        },
+                    ],
+                },
+            ]
+        }
+
+        result = json_to_df(response, self.GROUP_BY, "UnblendedCost")
+
+        assert list(result.columns) == [
+            "StartDate",
+            "EndDate",
+            "Service",
+            "Region",
+            "Cost",
+        ]
+        assert list(result["Service"]) == ["Amazon EC2", "Amazon S3", "Amazon EC2"]
+        assert list(result["Region"]) == ["us-east-1", "us-west-2", "us-east-1"]
+        assert isinstance(result["Service"].dtype, pd.CategoricalDtype)
+        assert isinstance(result["Region"].dtype, pd.CategoricalDtype)
+        assert list(result["Cost"]) == [10.5, 2.0, 7.25]
+        assert pd.api.types.is_datetime64_dtype(result["StartDate"])
+        assert pd.api.types.is_datetime64_dtype(result["EndDate"])
+        assert list(result["StartDate"]) == [
+            pd.Timestamp(2025, 1, 1),
+            pd.Timestamp(2025, 1, 1),
+            pd.Timestamp(2025, 2, 1),
+        ]
+
+    def test_no_groups_returns_columns(self):
+        response = {
+            "ResultsByTime": [
+                {
+                    "TimePeriod": {"Start": "2025-01-01", "End": "2025-02-01"},
+                    "Groups": [],
+                }
+            ]
+        }
+
+        result = json_to_df(response, self.GROUP_BY, "UnblendedCost")
+
+        assert result.empty
+        assert list(result.columns) == [
+            "StartDate",
+            "EndDate",
+            "Service",
+            "Region",
+            "Cost",
+        ]
+        # The empty frame has the same dtypes as a populated one.
+        assert result["StartDate"].dtype == "datetime64[ns]"
+        assert isinstance(result["Service"].dtype, pd.CategoricalDtype)
+        assert result["Cost"].dtype == "float64"
+
+    def test_tag_group_is_named_and_stripped(self):
+        response = {
+            "ResultsByTime": [
+                {
+                    "TimePeriod": {"Start": "2025-01-01", "End": "2025-02-01"},
+                    "Groups": [
+                        {
+                            "Keys": ["Amazon EC2", "env$prod"],
+                            "Metrics": {"UnblendedCost": {"Amount": "1"}},
+                        },
+                        {
+                            "Keys": ["Amazon EC2", "env$"],
+                            "Metrics": {"UnblendedCost": {"Amount": "2"}},
+                        },
+                    ],
+                }
+            ]
+        }
+        group_by = [
+            {"Type": "DIMENSION", "Key": "SERVICE"},
+            {"Type": "TAG", "Key": "env"},
+        ]
+
+        result = json_to_df(response, group_by, "UnblendedCost")
+
+        assert "env" not in result.columns
+        assert list(result["Tag"]) == ["prod", ""]
+
+
 class TestFetchGroupByCost:
     """Tests for _fetch_group_by_cost helper."""
 
@@ -479,6 +773,111 @@ class TestFetchGroupByCost:
         assert result.empty
         assert list(result.columns) == ["StartDate", "EndDate", "Service", "Cost"]
 
+    @patch("aws_cost_tool.cost_explorer.paginate_ce")
+    def test_multiple_pages_combined(self, mock_paginate):
+        def page(start: str, end: str, amount: str) -> dict:
+            return {
+                "ResultsByTime": [
+                    {
+                        "TimePeriod": {"Start": start, "End": end},
+                        "Groups": [
+                            {
+                                "Keys": ["Amazon EC2"],
+                                "Metrics": {"UnblendedCost": {"Amount": amount}},
+                            }
+                        ],
+                    }
+                ]
+            }
+
+        mock_paginate.return_value = [
+            page("2025-01-01", "2025-01-02", "1.5"),
+            page("2025-01-02", "2025-01-03", "2.5"),
+        ]
+        dates = DateRange.create(start="2025-01-01", end="2025-01-03")
+
+        result = _fetch_group_by_cost(
+            Mock(),
+            dates=dates,
+            group_by=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+            cost_metric="UnblendedCost",
+            granularity="DAILY",
+        )
+
+        assert list(result.index) == [0, 1]
+        assert list(result["Cost"]) == [1.5, 2.5]
+
+    @patch("aws_cost_tool.cost_explorer.json_to_df")
+    @patch("aws_cost_tool.cost_explorer.paginate_ce")
+    def test_empty_periods_skipped(self, mock_paginate, mock_json_to_df):
+        empty = {"TimePeriod": {"Start": "2025-01-01", "End": "2025-01-02"}}
+        mock_paginate.return_value = [
+            {"ResultsByTime": [{**empty, "Groups": []}]},
+            {"ResultsByTime": [empty]},
+        ]
+        dates = DateRange.create(start="2025-01-01", end="2025-01-03")
+
+        _fetch_group_by_cost(
+            Mock(),
+            dates=dates,
+            group_by=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+            cost_metric="UnblendedCost",
+            granularity="DAILY",
+        )
+
+        assert mock_json_to_df.call_args.args[0] == {"ResultsByTime": []}
+
+
+class TestFetchByRegion:
+    """Tests for _fetch_by_region helper."""
+
+    @patch("aws_cost_tool.cost_explorer._fetch_periods")
+    def test_preserves_region_order_and_drops_empty(self, mock_fetch):
+        def fake_fetch(_client, *, filter_expr, **_kwargs):
+            region = filter_expr["And"][0]["Dimensions"]["Values"][0]
+            if region == "eu-west-1":
+                return []
+            return _periods(([f"svc-{region}"], "1.0"))
+
+        mock_fetch.side_effect = fake_fetch
+        exclude = {"Not": {"Dimensions": {"Key": "X", "Values": ["Y"]}}}
+
+        result = _fetch_by_region(
+            Mock(),
+            ["us-west-2", "eu-west-1", "us-east-1"],
+            dates=DateRange.create(start="2025-01-01", end="2025-02-01"),
+            group_by=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+            filter_expr=exclude,
+            cost_metric="UnblendedCost",
+            granularity="MONTHLY",
+        )
+
+        assert list(result["Region"]) == ["us-west-2", "us-east-1"]
+        assert list(result["Service"]) == ["svc-us-west-2", "svc-us-east-1"]
+        assert mock_fetch.call_count == 3
+        for call in mock_fetch.call_args_list:
+            assert call.kwargs["filter_expr"]["And"][1] == exclude
+
+    def test_no_regions(self):
+        result = _fetch_by_region(
+            Mock(),
+            [],
+            dates=DateRange.create(start="2025-01-01", end="2025-02-01"),
+            group_by=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+            filter_expr={},
+            cost_metric="UnblendedCost",
+            granularity="MONTHLY",
+        )
+
+        assert result.empty
+        assert list(result.columns) == [
+            "StartDate",
+            "EndDate",
+            "Service",
+            "Region",
+            "Cost",
+        ]
+
 
 class TestSummarizeByColumns:
     """Tests for summarize_by_columns function."""
@@ -560,6 +959,23 @@ class TestPivotData:
         assert result.loc["2025-01", "S3"] == 0.0
         assert result.loc["2025-02", "EC2"] == 0.0
 
+    def test_axes_sorted(self):
+        """Both axes come out sorted regardless of input order."""
+        df = pd.DataFrame(
+            [
+                {"StartDate": "2025-02", "Service": "S3", "Cost": 50.0},
+                {"StartDate": "2025-01", "Service": "EC2", "Cost": 100.0},
+                {"StartDate": "2025-02", "Service": "EC2", "Cost": 20.0},
+                {"StartDate": "2025-02", "Service": "EC2", "Cost": 30.0},
+            ]
+        )
+
+        result = pivot_data(df, row_label="StartDate", col_label="Service", threshold=0)
+
+        assert list(result.index) == ["2025-01", "2025-02"]
+        assert list(result.columns) == ["EC2", "S3"]
+        assert result.loc["2025-02", "EC2"] == 50.0
+
     def test_with_threshold(self):
         """Test pivot with cost threshold."""
         df = pd.DataFrame(
@@ -1,6 +1,9 @@
+import gc
+
 import pandas as pd
 import pytest
 
+from aws_cost_tool import cost_reports
 from aws_cost_tool.cost_reports import filter_preserve_date_range, generate_cost_report
 
 
@@ -61,6 +64,21 @@ def test_generate_cost_report_top_n(aws_cost_df):
     assert list(pivot.index) == ["D", "A", "Other", "C"]
 
 
+def test_generate_cost_report_top_n_ties():
+    # B, C and D tie for second place; the first of them in row order wins.
+    df = pd.DataFrame(
+        {
+            "StartDate": ["2025-01-01"] * 5,
+            "Service": ["A", "B", "C", "D", "E"],
+            "Cost": [30.0, 20.0, 20.0, 20.0, 5.0],
+        }
+    )
+
+    pivot, _ = generate_cost_report(df, "Service", selector=2)
+
+    assert list(pivot.index) == ["Other", "A", "B"]
+
+
 def test_generate_cost_report_row_list(aws_cost_df):
     # Month 1: A=10, B=5, C=100, D=50 (C, D are Top 2)
     # Month 2: A=20, B=15, C=1, D=50  (A, D are Top 2)
@@ -92,6 +110,48 @@ def test_generate_cost_report_row_list(aws_cost_df):
     assert list(pivot.index) == ["Other", "A", "C"]
 
 
+def test_generate_cost_report_categorical_rows(aws_cost_df):
+    aws_cost_df["Service"] = aws_cost_df["Service"].astype("category")
+
+    pivot, _ = generate_cost_report(aws_cost_df, "Service", selector=2)
+
+    # The Other row can be added even though it is not one of the categories.
+    assert list(pivot.index) == ["D", "A", "Other", "C"]
+
+
+def test_generate_cost_report_cache_pivot(aws_cost_df, mocker):
+    spy = mocker.spy(cost_reports, "_pivot_costs")
+    # The fixture keeps its own reference, so use a frame only the test holds.
+    df = aws_cost_df.copy()
+
+    first, _ = generate_cost_report(df, "Service", selector=2, cache_pivot=True)
+    second, _ = generate_cost_report(df, "Service", selector=1, cache_pivot=True)
+    assert spy.call_count == 1
+    # The selection still applies to the cached pivot.
+    assert list(first.index) == ["D", "A", "Other", "C"]
+    assert list(second.index) == ["D", "Other", "C"]
+
+    # The entry goes away with the frame; the spy also holds on to it.
+    spy.reset_mock()
+    del df
+    gc.collect()
+    assert not cost_reports._pivot_cache
+
+
+def test_generate_cost_report_nan_cost(aws_cost_df):
+    # Blank cost cells, e.g. from file data, are skipped like pivot_table did.
+    aws_cost_df.loc[len(aws_cost_df)] = {
+        "StartDate": "2025-01-01",
+        "Service": "A",
+        "Cost": float("nan"),
+    }
+
+    pivot, total = generate_cost_report(aws_cost_df, "Service")
+
+    assert pivot.loc["A", "2025-01-01"] == 10.0
+    assert total.loc["Total", "2025-01-01"] == 165.0
+
+
 def test_generate_cost_report_empty_selector(aws_cost_df):
     with pytest.raises(RuntimeError, match="No rows selected"):
         generate_cost_report(aws_cost_df, "Service", selector=["X", "Y", "Z"])
@@ -136,6 +196,13 @@ def test_filter_matching_nothing(sample_df):
     assert (result["Category"] == "Cloud").all()
 
 
+def test_no_filters_keeps_every_row(sample_df):
+    result = filter_preserve_date_range(sample_df, {})
+
+    assert len(result) == 3
+    assert result["Cost"].tolist() == [100, 200, 300]
+
+
 def test_multiple_filters(sample_df):
     # Add a column to sample to test multi-filter
     sample_df["Region"] = ["US", "US", "EU"]
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import pytest
+
+from aws_cost_tool.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket class."""
+
+    @patch("aws_cost_tool.rate_limit.time.sleep")
+    @patch("aws_cost_tool.rate_limit.time.monotonic", return_value=0.0)
+    def test_burst_does_not_sleep(self, mock_monotonic, mock_sleep):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        for _ in range(3):
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch("aws_cost_tool.rate_limit.time.sleep")
+    @patch("aws_cost_tool.rate_limit.time.monotonic", return_value=0.0)
+    def test_empty_bucket_waits_for_refill(self, mock_monotonic, mock_sleep):
+        bucket = TokenBucket(rate=2.0, burst=1)
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        # Each queued caller waits one more refill interval than the last.
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [
+            pytest.approx(0.5),
+            pytest.approx(1.0),
+        ]
+
+    @patch("aws_cost_tool.rate_limit.time.sleep")
+    @patch("aws_cost_tool.rate_limit.time.monotonic")
+    def test_refill_over_time(self, mock_monotonic, mock_sleep):
+        mock_monotonic.side_effect = [0.0, 0.0, 0.0, 10.0, 10.0]
+        bucket = TokenBucket(rate=1.0, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        # Plenty of time has passed, but the bucket never holds more than burst.
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="rate must be > 0"):
+            TokenBucket(rate=0, burst=1)
+        with pytest.raises(ValueError, match="burst must be >= 1"):
+            TokenBucket(rate=1.0, burst=0)
@@ -0,0 +1,132 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from aws_cost_tool.response_cache import ResponseCache
+
+
+def make_params(start: str, end: str) -> dict:
+    return {
+        "TimePeriod": {"Start": start, "End": end},
+        "Granularity": "MONTHLY",
+        "Metrics": ["UnblendedCost"],
+    }
+
+
+PAGES = [{"ResultsByTime": [], "ResponseMetadata": {"RequestId": "abc"}}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path, open_ttl=60)
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_miss(self, cache):
+        assert cache.get(make_params("2025-01-01", "2025-02-01")) is None
+
+    def test_round_trip_drops_metadata(self, cache):
+        params = make_params("2025-01-01", "2025-02-01")
+        cache.put(params, PAGES)
+
+        assert cache.get(params) == [{"ResultsByTime": []}]
+
+    def test_key_ignores_dict_order(self, cache):
+        params = make_params("2025-01-01", "2025-02-01")
+        cache.put(params, PAGES)
+
+        reordered = dict(reversed(list(params.items())))
+        assert cache.get(reordered) is not None
+
+    @patch("aws_cost_tool.response_cache.time.time")
+    @patch("aws_cost_tool.response_cache.date")
+    def test_closed_months_never_expire(self, mock_date, mock_time, cache):
+        mock_date.today.return_value = date(2025, 3, 15)
+        mock_date.fromisoformat = date.fromisoformat
+        mock_time.return_value = 0.0
+        params = make_params("2025-01-01", "2025-03-01")
+        cache.put(params, PAGES)
+
+        mock_time.return_value = 1e9
+        assert cache.get(params) is not None
+
+    @patch("aws_cost_tool.response_cache.time.time")
+    @patch("aws_cost_tool.response_cache.date")
+    def test_open_month_expires(self, mock_date, mock_time, cache):
+        mock_date.today.return_value = date(2025, 3, 15)
+        mock_date.fromisoformat = date.fromisoformat
+        mock_time.return_value = 0.0
+        params = make_params("2025-02-01", "2025-03-15")
+        cache.put(params, PAGES)
+
+        mock_time.return_value = 59.0
+        assert cache.get(params) is not None
+        mock_time.return_value = 60.0
+        assert cache.get(params) is None
+
+    @patch("aws_cost_tool.response_cache.time.time")
+    @patch("aws_cost_tool.response_cache.date")
+    def test_last_month_open_during_grace(self, mock_date, mock_time, cache):
+        mock_date.today.return_value = date(2025, 3, 2)
+        mock_date.fromisoformat = date.fromisoformat
+        mock_time.return_value = 0.0
+        params = make_params("2025-02-01", "2025-03-01")
+        cache.put(params, PAGES)
+
+        mock_time.return_value = 60.0
+        assert cache.get(params) is None
+
+    @patch("aws_cost_tool.response_cache.time.time")
+    @patch("aws_cost_tool.response_cache.date")
+    def test_expired_entry_is_deleted(self, mock_date, mock_time, cache):
+        mock_date.today.return_value = date(2025, 3, 15)
+        mock_date.fromisoformat = date.fromisoformat
+        mock_time.return_value = 0.0
+        cache.put(make_params("2025-03-01", "2025-03-15"), PAGES)
+
+        mock_time.return_value = 60.0
+        assert cache.get(make_params("2025-03-01", "2025-03-15")) is None
+        assert not list(cache.directory.glob("*.json"))
+
+    @patch("aws_cost_tool.response_cache.date")
+    def test_clear_open_only(self, mock_date, cache):
+        mock_date.today.return_value = date(2025, 3, 15)
+        mock_date.fromisoformat = date.fromisoformat
+        closed = make_params("2025-01-01", "2025-03-01")
+        open_ = make_params("2025-02-01", "2025-03-15")
+        cache.put(closed, PAGES)
+        cache.put(open_, PAGES)
+
+        cache.clear(open_only=True)
+        assert cache.get(closed) is not None
+        assert cache.get(open_) is None
+
+        cache.clear()
+        assert cache.get(closed) is None
+
+    def test_entry_without_pages_is_dropped(self, cache):
+        params = make_params("2025-01-01", "2025-02-01")
+        cache.put(params, PAGES)
+        path = next(cache.directory.glob("*.json"))
+        path.write_text('{"expires": null}')
+
+        assert cache.get(params) is None
+        assert not path.exists()
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        params = make_params("2025-01-01", "2025-02-01")
+        cache.put(params, PAGES)
+        next(cache.directory.glob("*.json")).write_text("{not json")
+
+        assert cache.get(params) is None
+
+    def test_directory_created_on_put(self, tmp_path):
+        cache = ResponseCache(tmp_path / "sub", open_ttl=60)
+        assert not cache.directory.exists()
+        assert cache.get(make_params("2025-01-01", "2025-02-01")) is None
+
+        cache.put(make_params("2025-01-01", "2025-02-01"), PAGES)
+        assert cache.directory.is_dir()
@@ -214,6 +214,16 @@ def test_strip_region_empty_df():
     assert df.empty
 
 
+def test_strip_region_empty_categorical_untouched():
+    """An empty slice of a categorical keeps its column as is."""
+    usage = pd.Series(["USE1-Storage", "USW2-Usage"], dtype="category")
+    df = pd.DataFrame({"Usage_type": usage}).iloc[:0]
+    ServiceBase.strip_region_prefix_from_usage(df)
+
+    assert isinstance(df["Usage_type"].dtype, pd.CategoricalDtype)
+    assert list(df["Usage_type"].cat.categories) == ["USE1-Storage", "USW2-Usage"]
+
+
 def test_strip_region_with_nan():
     """Tests behavior when column contains NaN values."""
     df = pd.DataFrame({"Usage_type": ["USW2-Usage", None]})
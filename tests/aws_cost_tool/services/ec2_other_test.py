@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
 from aws_cost_tool.services.ec2_other import (
+    EC2Other,
+    classify_ec2_other_usage,
     extract_data_transfer_costs,
     extract_ebs_costs,
     extract_nat_gateway_costs,
@@ -107,3 +111,40 @@ def test_extractors_handle_no_matches():
     assert extract_ebs_costs(df).empty
     assert extract_nat_gateway_costs(df).empty
     assert extract_data_transfer_costs(df).empty
+
+
+## --- Tests for the fused classifier ---
+
+
+def test_classify_ec2_other_usage(ec2_other_df):
+    result = classify_ec2_other_usage(ec2_other_df)
+
+    assert list(result.index) == [101, 102, 103, 105, 106, 107, 108]
+    assert list(result["Category"]) == [
+        "EBS",
+        "EBS",
+        "EBS",
+        "VPC",
+        "VPC",
+        "Data Transfer",
+        "Data Transfer",
+    ]
+    assert result.loc[106, "Usage_type"] == "NatGateway-Bytes"
+    assert result.loc[106, "Subtype"] == "NAT Gateway Bytes"
+
+
+def test_categorize_usage_classifies_once(ec2_other_df):
+    with patch(
+        "aws_cost_tool.services.ec2_other.classify_ec2_other_usage",
+        wraps=classify_ec2_other_usage,
+    ) as mock_classify:
+        result = EC2Other().categorize_usage(ec2_other_df)
+
+    mock_classify.assert_called_once()
+    # EBSOptimized is not classified, so it ends up in Other.
+    assert result.groupby("Category")["Cost"].sum().to_dict() == {
+        "Data Transfer": 7.0,
+        "EBS": 17.0,
+        "Other": 1.0,
+        "VPC": 23.0,
+    }